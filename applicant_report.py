@@ -0,0 +1,40 @@
+"""
+Applicant report conventions shared by parse_tsv.py, which writes the
+report, and voting_dashboard.py, which reads it: expertise tags, experience
+levels and where the analytics JSON lives.
+
+Kept free of heavy imports (pandas, openpyxl) so the dashboard can load it
+right after the password gate.
+"""
+
+import os
+
+# Expertise categories and the background keywords that indicate them
+EXPERTISE_KEYWORDS = {
+    'AI/Machine Learning': ['ai', 'ml', 'machine learning', 'artificial intelligence', 'deep learning', 'neural', 'llm'],
+    'Engineering': ['engineering', 'engineer', 'aerospace', 'systems', 'electrical', 'mechanical', 'software', 'hardware'],
+    'Design (HCD/UX)': ['design', 'human-centered', 'ux', 'user experience', 'industrial', 'hcd'],
+    'Cybersecurity': ['cybersecurity', 'security', 'cyber', 'encryption'],
+    'Data Science': ['data', 'analytics', 'analysis', 'database', 'statistical'],
+    'Research': ['research', 'researcher'],
+    'Leadership/Management': ['manager', 'lead', 'officer', 'director', 'management', 'leadership'],
+    'Military': ['military', 'marine', 'army', 'navy', 'air force', 'infantry', 'commissioned'],
+    'Policy/Government': ['policy', 'government', 'federal', 'political'],
+}
+
+def classify_expertise(text):
+    """Return the expertise categories matched by one background response"""
+    if not text or not text.strip() or '[NO RESPONSE]' in text.upper():
+        return []
+    
+    text_lower = text.lower()
+    return [category for category, keywords in EXPERTISE_KEYWORDS.items()
+            if any(keyword in text_lower for keyword in keywords)]
+
+# Experience levels (Q24) in display order, with the short labels used in the cross-tab
+EXPERIENCE_LEVELS = ['Entry level (0-2 years)', 'Novice (2-5 years)', 'Intermediate (5-10 years)', 'Advanced (10-15 years)', 'Expert (15+ years)']
+EXPERIENCE_LEVELS_SHORT = ['Entry', 'Novice', 'Intermediate', 'Advanced', 'Expert']
+
+def analytics_artifact_path(output_file):
+    """Analytics JSON lives next to the report: Report.xlsx -> Report_analytics.json"""
+    return os.path.splitext(output_file)[0] + '_analytics.json'
@@ -0,0 +1,150 @@
+"""
+Inverted-index full-text search over applicant responses.
+
+The index is built once from the applicant data loaded by the dashboard and
+supports:
+- plain terms:            llm prototype       (implicit AND)
+- quoted phrases:         "machine learning"
+- boolean AND / OR:       "human-centered" AND ACL OR llm
+  (AND binds tighter than OR)
+
+Matches are ranked with BM25 and returned with a highlighted snippet from
+the best-matching response. Profile tags (unit, experience level, expertise
+areas) are indexed too, so "ACL AND HCD" finds applicants by unit and
+background.
+"""
+
+import math
+import re
+from collections import defaultdict
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+QUERY_PATTERN = re.compile(r'"[^"]*"|\S+')
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Position gap between fields so phrases don't match across two responses
+FIELD_GAP = 10
+
+SNIPPET_CHARS = 160
+
+
+def normalize(token):
+    """Light plural folding so "LLMs" matches "llm" and vice versa"""
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    return [normalize(t) for t in TOKEN_PATTERN.findall(str(text).lower())]
+
+
+def parse_query(query):
+    """
+    Parse a query into OR-clauses of AND-ed phrases:
+    'a "b c" OR d' -> [[['a'], ['b', 'c']], [['d']]]
+    """
+    clauses = [[]]
+    for part in QUERY_PATTERN.findall(query):
+        if part.upper() == 'OR':
+            clauses.append([])
+        elif part.upper() == 'AND':
+            continue
+        else:
+            phrase = tokenize(part.strip('"'))
+            if phrase:
+                clauses[-1].append(phrase)
+    return [clause for clause in clauses if clause]
+
+
+class ApplicantSearchIndex:
+    """Positional inverted index: term -> {applicant: [positions]}"""
+
+    def __init__(self, applicants, profiles=None):
+        self.postings = defaultdict(dict)
+        self.doc_lengths = {}
+        self.fields = {}
+
+        for name, responses in applicants.items():
+            fields = [(question, str(response)) for question, response in responses.items()
+                      if response and response != "[No response]"]
+            if profiles and profiles.get(name, {}).get('tags'):
+                fields.append(("Tags", " · ".join(profiles[name]['tags'])))
+            self.fields[name] = fields
+
+            position = 0
+            for _, text in fields:
+                for token in tokenize(text):
+                    self.postings[token].setdefault(name, []).append(position)
+                    position += 1
+                position += FIELD_GAP
+            self.doc_lengths[name] = position
+
+        self.doc_count = len(self.doc_lengths)
+        self.avg_length = (sum(self.doc_lengths.values()) / self.doc_count) if self.doc_count else 0
+
+    def _phrase_matches(self, phrase):
+        """Return {applicant: occurrence count} for a term or phrase"""
+        first = self.postings.get(phrase[0], {})
+        if len(phrase) == 1:
+            return {name: len(positions) for name, positions in first.items()}
+
+        rest = [self.postings.get(term, {}) for term in phrase[1:]]
+        matches = {}
+        for name, positions in first.items():
+            if not all(name in postings for postings in rest):
+                continue
+            following = [set(postings[name]) for postings in rest]
+            count = sum(1 for p in positions
+                        if all(p + i in following[i - 1] for i in range(1, len(phrase))))
+            if count:
+                matches[name] = count
+        return matches
+
+    def _bm25(self, tf, df, name):
+        idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+        norm = 1 - B + B * self.doc_lengths[name] / self.avg_length if self.avg_length else 1
+        return idf * tf * (K1 + 1) / (tf + K1 * norm)
+
+    def search(self, query, limit=None):
+        """Return ranked [(applicant, score, snippet)] for a query string"""
+        clauses = parse_query(query)
+        scores = defaultdict(float)
+
+        for clause in clauses:
+            phrase_matches = [self._phrase_matches(phrase) for phrase in clause]
+            names = set.intersection(*(set(m) for m in phrase_matches))
+            for name in names:
+                clause_score = sum(self._bm25(m[name], len(m), name) for m in phrase_matches)
+                scores[name] = max(scores[name], clause_score)
+
+        terms = {term for clause in clauses for phrase in clause for term in phrase}
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit:
+            ranked = ranked[:limit]
+        return [(name, score, self.snippet(name, terms)) for name, score in ranked]
+
+    def snippet(self, name, terms):
+        """Highlight query terms in the applicant's best-matching response"""
+        if not terms:
+            return ""
+        pattern = re.compile(r"\b(" + "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)) + r")\w*",
+                             re.IGNORECASE)
+
+        best = max(self.fields[name], key=lambda field: len(pattern.findall(field[1])), default=None)
+        if best is None:
+            return ""
+        question, text = best
+        match = pattern.search(text)
+        if match is None:
+            return ""
+
+        start = max(0, match.start() - SNIPPET_CHARS // 3)
+        end = min(len(text), start + SNIPPET_CHARS)
+        excerpt = pattern.sub(lambda m: f"**{m.group(0)}**", text[start:end])
+        prefix = "..." if start > 0 else ""
+        suffix = "..." if end < len(text) else ""
+        return f"_{question[:60]}_: {prefix}{excerpt}{suffix}"
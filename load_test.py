@@ -0,0 +1,513 @@
+"""
+Load test for voting_dashboard.py.
+
+Drives N simulated judge sessions headlessly with Streamlit's AppTest
+against an in-memory stand-in for Firestore, using a synthetic applicant
+report and a seeded votes collection, and reports:
+- rerun latency (p50/p95/p99) per interaction and overall
+- Firestore document reads and writes per interaction
+- memory per session (resident memory each added session costs)
+
+Each judge logs in, enters their name, switches to "next unvoted" mode and
+then votes and moves on a few times. All sessions share one process, so
+they share the dashboard's caches, the vote store and its listeners, like
+judges on one Streamlit server.
+
+Release gate: run at the target size (the defaults, about 15 minutes)
+before a release; the script exits with status 1 if any TARGET threshold
+is missed.
+    python load_test.py
+    python load_test.py --judges 5 --applicants 50 --votes-per-judge 3
+
+Notes on what is measured:
+- AppTest swaps process-wide Streamlit state on every run, so sessions
+  take turns: interactions are interleaved round-robin across judges but
+  never run in parallel. Latencies are per-rerun service times.
+- AppTest reruns the whole script for every interaction, including ones a
+  browser scopes to a fragment, so those latencies are upper bounds.
+- Reads follow Firestore billing: one per document returned (at least one
+  per query), plus listener updates. The listener's first snapshot of the
+  seeded votes is billed once per process, at the first login, so reads
+  are also gated on the interactions after login.
+- Memory per session is the growth in resident memory (Linux /proc) from
+  a few extra sessions opened after the run, when every shared cache is
+  warm. It includes AppTest's own per-session objects, so it is an upper
+  bound. Session state alone is reported alongside.
+"""
+
+import argparse
+import asyncio
+import datetime
+import gc
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+# Release target: judging day at full size. Read and memory limits sit just
+# above what the dashboard measures at this size (about 19 reads overall,
+# 1.3 after login, about 5 MB per session), so a regression fails the gate
+TARGET = {
+    'judges': 25,
+    'applicants': 500,
+    'p95_seconds': 4.0,
+    'p99_seconds': 6.0,
+    'reads_per_interaction': 25,
+    'reads_after_login': 3,
+    'session_mb': 7.0,
+}
+
+# Extra sessions opened after the run to measure memory per session
+MEMORY_SESSIONS = 5
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "voting_dashboard.py")
+PASSWORD = "load-test"
+UNITS = ['ACL', 'CIPHER', 'ELSYS', 'SEAL', 'ICL', 'ATAS']
+EXPERIENCE = ['Entry level (0-2 years)', 'Novice (2-5 years)', 'Intermediate (5-10 years)', 'Expert (10+ years)']
+WORDS = ("machine learning radar systems engineering human centered design stakeholder interviews "
+         "cybersecurity networks sensors autonomy software prototyping data analysis signal processing "
+         "business development customer discovery problem framing teamwork leadership").split()
+
+
+# ===== IN-MEMORY FIRESTORE =====
+class MemoryDocument:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class MemoryQuery:
+    """Collection/query stand-in: where, order_by, limit, stream and on_snapshot"""
+
+    def __init__(self, store, path, filters=(), orders=(), limit_to=None):
+        self.store = store
+        self.path = path
+        self.filters = list(filters)
+        self.orders = list(orders)
+        self.limit_to = limit_to
+
+    def where(self, field_path=None, op_string=None, value=None, *, filter=None):
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        return MemoryQuery(self.store, self.path, self.filters + [(field_path, op_string, value)], self.orders, self.limit_to)
+
+    def order_by(self, field_path, direction="ASCENDING"):
+        return MemoryQuery(self.store, self.path, self.filters, self.orders + [(field_path, direction)], self.limit_to)
+
+    def limit(self, count):
+        return MemoryQuery(self.store, self.path, self.filters, self.orders, count)
+
+    def document(self, doc_id):
+        return MemoryDocumentRef(self.store, self.path, doc_id)
+
+    def _matches(self):
+        ops = {'==': lambda a, b: a == b, 'in': lambda a, b: a in b, '<': lambda a, b: a < b,
+               '<=': lambda a, b: a <= b, '>': lambda a, b: a > b, '>=': lambda a, b: a >= b}
+        with self.store.lock:
+            items = list(self.store.collections.get(self.path, {}).items())
+        for field, op, value in self.filters:
+            items = [(doc_id, data) for doc_id, data in items if field in data and ops[op](data[field], value)]
+        for field, direction in reversed(self.orders):
+            items.sort(key=lambda item: item[1].get(field), reverse=str(direction).upper() == "DESCENDING")
+        if self.limit_to is not None:
+            items = items[:self.limit_to]
+        self.store.count_reads(len(items))
+        return [MemoryDocument(doc_id, data) for doc_id, data in items]
+
+    def stream(self):
+        time.sleep(self.store.latency)
+        return iter(self._matches())
+
+    def get(self):
+        return list(self.stream())
+
+    def on_snapshot(self, callback):
+        return self.store.listen(self.path, callback)
+
+
+class MemoryDocumentRef:
+    def __init__(self, store, path, doc_id):
+        self.store = store
+        self.path = path
+        self.id = doc_id
+
+    def set(self, data, merge=False):
+        time.sleep(self.store.latency)
+        self.store.write(self.path, self.id, data, merge)
+
+    def create(self, data):
+        from google.api_core.exceptions import AlreadyExists
+        time.sleep(self.store.latency)
+        with self.store.lock:
+            if self.id in self.store.collections.get(self.path, {}):
+                raise AlreadyExists(f"Document already exists: {self.path}/{self.id}")
+            self.store.write(self.path, self.id, data)
+
+    def get(self):
+        time.sleep(self.store.latency)
+        with self.store.lock:
+            data = self.store.collections.get(self.path, {}).get(self.id)
+        self.store.count_reads(1)
+        return MemoryDocument(self.id, data)
+
+    def collection(self, name):
+        return MemoryQuery(self.store, f"{self.path}/{self.id}/{name}")
+
+
+class MemoryWatch:
+    def __init__(self, store, path, callback):
+        self.store, self.path, self.callback = store, path, callback
+
+    def unsubscribe(self):
+        with self.store.lock:
+            self.store.listeners[self.path].remove(self.callback)
+
+
+class MemoryFirestore:
+    """In-memory stand-in for the Firestore client API the dashboard uses"""
+
+    def __init__(self, latency=0.0):
+        self.collections = defaultdict(dict)   # collection path -> {doc_id: data}
+        self.listeners = defaultdict(list)
+        self.latency = latency
+        self.reads = 0
+        self.writes = 0
+        self.lock = threading.RLock()
+
+    def collection(self, path):
+        return MemoryQuery(self, path)
+
+    def count_reads(self, documents):
+        with self.lock:
+            self.reads += max(documents, 1)
+
+    def write(self, path, doc_id, data, merge=False):
+        from firebase_admin import firestore
+        from google.cloud.firestore_v1.watch import ChangeType, DocumentChange
+        now = datetime.datetime.now(datetime.timezone.utc)
+        data = {key: (now if value is firestore.SERVER_TIMESTAMP else value) for key, value in data.items()}
+        with self.lock:
+            docs = self.collections[path]
+            change_type = ChangeType.MODIFIED if doc_id in docs else ChangeType.ADDED
+            docs[doc_id] = {**docs.get(doc_id, {}), **data} if merge else data
+            self.writes += 1
+            callbacks = list(self.listeners[path])
+            snapshot = [MemoryDocument(key, value) for key, value in docs.items()]
+        changes = [DocumentChange(change_type, MemoryDocument(doc_id, docs[doc_id]), -1, -1)]
+        for callback in callbacks:
+            self.count_reads(1)  # every listener is billed for the changed document
+            callback(snapshot, changes, now)
+
+    def listen(self, path, callback):
+        from google.cloud.firestore_v1.watch import ChangeType, DocumentChange
+        with self.lock:
+            self.listeners[path].append(callback)
+            docs = [MemoryDocument(doc_id, data) for doc_id, data in self.collections[path].items()]
+        self.count_reads(len(docs))
+        # Like Firestore, the first snapshot reports every existing document as added
+        changes = [DocumentChange(ChangeType.ADDED, doc, -1, i) for i, doc in enumerate(docs)]
+        callback(docs, changes, datetime.datetime.now(datetime.timezone.utc))
+        return MemoryWatch(self, path, callback)
+
+
+class MemoryAsyncQuery:
+    """AsyncClient-style wrapper: same query builder, async stream()"""
+
+    def __init__(self, query):
+        self.query = query
+
+    def where(self, *args, **kwargs):
+        return MemoryAsyncQuery(self.query.where(*args, **kwargs))
+
+    def order_by(self, *args, **kwargs):
+        return MemoryAsyncQuery(self.query.order_by(*args, **kwargs))
+
+    def limit(self, count):
+        return MemoryAsyncQuery(self.query.limit(count))
+
+    async def stream(self):
+        await asyncio.sleep(self.query.store.latency)
+        for doc in self.query._matches():
+            yield doc
+
+
+class MemoryAsyncFirestore:
+    def __init__(self, store):
+        self.store = store
+
+    def collection(self, path):
+        return MemoryAsyncQuery(self.store.collection(path))
+
+
+def install_stand_in(store):
+    """Point firebase_admin at the in-memory store (the dashboard looks these up at call time)"""
+    import firebase_admin
+    from firebase_admin import credentials, firestore, firestore_async
+
+    firebase_admin.initialize_app = lambda *args, **kwargs: None
+    credentials.Certificate = lambda *args, **kwargs: None
+    firestore.client = lambda *args, **kwargs: store
+    firestore_async.client = lambda *args, **kwargs: MemoryAsyncFirestore(store)
+
+
+# ===== SYNTHETIC DATA =====
+def write_applicant_report(path, applicant_names, rng):
+    """Applicant report in parse_tsv.py's layout: a Summary sheet and one sheet per applicant"""
+    import openpyxl
+
+    wb = openpyxl.Workbook(write_only=True)
+    summary = wb.create_sheet("Summary")
+    summary.append(['Metric', 'Value'])
+    summary.append(['Total Applicants', len(applicant_names)])
+
+    for name in applicant_names:
+        ws = wb.create_sheet(name)
+        ws.append(['Question ID', 'Question', 'Response'])
+        ws.append(['Q3', 'What is your name?', name])
+        ws.append(['Q4', 'Which unit are you a part of?', rng.choice(UNITS)])
+        ws.append(['Q22', 'What is your background?', " ".join(rng.choices(WORDS, k=8))])
+        ws.append(['Q24', 'What is your experience level?', rng.choice(EXPERIENCE)])
+        for qid in ['Q18', 'Q21', 'Q33']:
+            ws.append([qid, f'Long answer question {qid}', " ".join(rng.choices(WORDS, k=120))])
+    wb.save(path)
+
+
+def seed_votes(store, judge_names, applicant_names, share, rng):
+    """Votes already cast before the test: each judge has voted on `share` of the applicants"""
+    from vote_schema import VOTE_STATUSES
+    start = datetime.datetime(2026, 2, 1, tzinfo=datetime.timezone.utc)
+    docs = store.collections['votes']
+    for judge in judge_names:
+        for applicant in rng.sample(applicant_names, int(len(applicant_names) * share)):
+            docs[f"{judge}_{applicant}_1"] = {
+                'timestamp': start + datetime.timedelta(minutes=rng.randrange(60 * 24)),
+                'judge_name': judge,
+                'applicant_name': applicant,
+                'status': rng.choice(VOTE_STATUSES),
+                'rating': rng.randint(1, 5),
+                'comment': "",
+                'original_status': "",
+                'original_rating': 0,
+                'vote_version': 1,
+            }
+
+
+# ===== SESSIONS =====
+def deep_size(obj, seen=None):
+    """Approximate bytes held by obj and everything it references"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(key, seen) + deep_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    return size
+
+
+class JudgeSession:
+    """One simulated judge driving their own AppTest session"""
+
+    def __init__(self, judge_name, store, rng, timeout):
+        from streamlit.testing.v1 import AppTest
+        self.judge_name = judge_name
+        self.store = store
+        self.rng = rng
+        self.at = AppTest.from_file(DASHBOARD, default_timeout=timeout)
+        self.at.secrets.update({key: "load-test" for key in [
+            "project_id", "private_key_id", "private_key", "client_email", "client_id", "client_x509_cert_url"]})
+        self.at.secrets['voting_password'] = PASSWORD
+        self.samples = []   # (interaction, seconds, reads, writes)
+
+    def run(self, interaction, action=None):
+        """Apply a widget action, rerun the script and record its cost"""
+        reads, writes = self.store.reads, self.store.writes
+        start = time.perf_counter()
+        (action() if action else self.at).run()
+        seconds = time.perf_counter() - start
+        if self.at.exception:
+            raise RuntimeError(f"{self.judge_name} / {interaction}: {self.at.exception[0].message}")
+        self.samples.append((interaction, seconds, self.store.reads - reads, self.store.writes - writes))
+
+    def focused_applicant(self):
+        labels = [e.label for e in self.at.expander if e.label.startswith("📋 ")]
+        return labels[0][len("📋 "):] if labels else None
+
+    def steps(self, votes):
+        """The judge's interactions, one per rerun"""
+        from vote_schema import VOTE_STATUSES
+        yield "open", None
+        yield "login", lambda: self.at.text_input(key="password").input(PASSWORD)
+        yield "enter name", lambda: self.at.text_input(key="judge_name_input").input(self.judge_name)
+        yield "next-unvoted mode", lambda: self.at.toggle(key="focus_next_unvoted").set_value(True)
+
+        for _ in range(votes):
+            applicant = self.focused_applicant()
+            if applicant is None:
+                return
+
+            def vote(applicant=applicant):
+                self.at.radio(key=f"status_default_{applicant}").set_value(self.rng.choice(VOTE_STATUSES))
+                self.at.slider(key=f"rating_default_{applicant}").set_value(self.rng.randint(1, 5))
+                return self.at.button(key=f"submit_default_{applicant}").click()
+
+            yield "vote", vote
+            yield "next unvoted", lambda: next(b for b in self.at.button if "Next unvoted" in b.label).click()
+
+    def session_bytes(self):
+        return deep_size(self.at.session_state.to_dict())
+
+
+def rss_mb():
+    """Resident memory of this process now, or None where /proc isn't available"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, ValueError):
+        return None
+
+
+def added_session_mb(store, count, seed, timeout):
+    """
+    Resident memory each extra judge session adds once the shared caches are
+    warm: `count` sessions log in, enter a name and switch to next-unvoted
+    mode. None where resident memory can't be read.
+    """
+    gc.collect()
+    before = rss_mb()
+    if before is None:
+        return None
+    sessions = [JudgeSession(f"Extra Judge {i + 1:02d}", store, random.Random(f"{seed}-extra-{i}"), timeout)
+                for i in range(count)]
+    for session in sessions:
+        for step in session.steps(0):
+            session.run(*step)
+    gc.collect()
+    return (rss_mb() - before) / count
+
+
+# ===== REPORT =====
+def summarize(samples):
+    df = pd.DataFrame(samples, columns=['Interaction', 'Seconds', 'Reads', 'Writes'])
+    order = list(dict.fromkeys(df['Interaction']))
+
+    def stats(group):
+        seconds = group['Seconds'].to_numpy()
+        return pd.Series({
+            'Count': len(group),
+            'p50 s': np.percentile(seconds, 50),
+            'p95 s': np.percentile(seconds, 95),
+            'p99 s': np.percentile(seconds, 99),
+            'Reads': group['Reads'].mean(),
+            'Writes': group['Writes'].mean(),
+        })
+
+    per_interaction = pd.DataFrame({name: stats(df[df['Interaction'] == name]) for name in order}).T
+    per_interaction.loc['all'] = stats(df)
+    per_interaction['Count'] = per_interaction['Count'].astype(int)
+    return per_interaction
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test voting_dashboard.py with simulated judges")
+    parser.add_argument("--judges", type=int, default=TARGET['judges'], help="Simulated judge sessions")
+    parser.add_argument("--applicants", type=int, default=TARGET['applicants'], help="Synthetic applicants")
+    parser.add_argument("--votes-per-judge", type=int, default=5, help="Votes each judge casts during the test")
+    parser.add_argument("--seed-share", type=float, default=0.5, help="Share of applicants each judge has already voted on")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Simulated Firestore round trip per query/write")
+    parser.add_argument("--timeout", type=float, default=300, help="Timeout per rerun in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    judge_names = [f"Judge {i + 1:02d}" for i in range(args.judges)]
+    applicant_names = [f"Applicant {i + 1:03d}" for i in range(args.applicants)]
+
+    store = MemoryFirestore(latency=args.latency_ms / 1000)
+    install_stand_in(store)
+    seed_votes(store, judge_names, applicant_names, args.seed_share, rng)
+
+    print(f"🧪 {args.judges} judges x {args.applicants} applicants, {len(store.collections['votes'])} seeded votes, "
+          f"{args.latency_ms:g} ms simulated latency")
+
+    # The dashboard reads its applicant report from the working directory
+    with tempfile.TemporaryDirectory(prefix="sting-load-test-") as workdir:
+        os.chdir(workdir)
+        write_applicant_report("fOutputAndaReport.xlsx", applicant_names, rng)
+
+        sessions = [JudgeSession(name, store, random.Random(f"{args.seed}-{name}"), args.timeout) for name in judge_names]
+        active = [(session, session.steps(args.votes_per_judge)) for session in sessions]
+
+        # Round-robin: every judge takes their next step before anyone takes another
+        started = time.perf_counter()
+        while active:
+            still_active = []
+            for session, steps in active:
+                step = next(steps, None)
+                if step is not None:
+                    session.run(*step)
+                    still_active.append((session, steps))
+            active = still_active
+            if active:
+                print(f"  ... {active[0][0].samples[-1][0]} done for {len(active)} judges "
+                      f"({time.perf_counter() - started:.0f}s)", flush=True)
+
+        samples = [sample for session in sessions for sample in session.samples]
+        reads, writes = store.reads, store.writes
+        session_mb = added_session_mb(store, MEMORY_SESSIONS, args.seed, args.timeout)
+        os.chdir(os.path.dirname(DASHBOARD))
+
+    report = summarize(samples)
+    state_mb = np.array([session.session_bytes() for session in sessions]) / 1e6
+    reads_after_login = np.mean([sample[2] for sample in samples if sample[0] not in ("open", "login")])
+
+    with pd.option_context('display.float_format', '{:.3f}'.format, 'display.width', 120):
+        print(report)
+    added = f"{session_mb:.2f} MB resident per added session" if session_mb is not None else "resident memory unavailable"
+    print(f"\nMemory per session: {added}; session state mean {state_mb.mean():.2f} MB, max {state_mb.max():.2f} MB "
+          f"(process peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB)")
+    print(f"Totals: {reads} reads, {writes} writes over {len(samples)} interactions "
+          f"({reads_after_login:.2f} reads per interaction after login)")
+
+    overall = report.loc['all']
+    checks = [
+        ("p95 rerun latency", overall['p95 s'], TARGET['p95_seconds'], "s"),
+        ("p99 rerun latency", overall['p99 s'], TARGET['p99_seconds'], "s"),
+        ("reads per interaction", overall['Reads'], TARGET['reads_per_interaction'], ""),
+        ("reads per interaction after login", reads_after_login, TARGET['reads_after_login'], ""),
+        ("memory per session", session_mb, TARGET['session_mb'], " MB"),
+    ]
+    failed = False
+    print()
+    for label, value, limit, unit in checks:
+        if value is None:
+            print(f"⚠️ {label}: not measured on this platform (target ≤ {limit:g}{unit})")
+            continue
+        ok = value <= limit
+        failed |= not ok
+        print(f"{'✅' if ok else '❌'} {label}: {value:.2f}{unit} (target ≤ {limit:g}{unit})")
+
+    if (args.judges, args.applicants) != (TARGET['judges'], TARGET['applicants']):
+        print(f"ℹ️ Release target is {TARGET['judges']} judges x {TARGET['applicants']} applicants")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
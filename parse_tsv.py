@@ -1,10 +1,29 @@
 import pandas as pd
+import numpy as np
 import csv
 import os
-from openpyxl.styles import Font, Alignment, PatternFill
+import hashlib
+import shutil
+from openpyxl.styles import Font, Alignment, PatternFill, NamedStyle, DEFAULT_FONT
 from openpyxl.chart import PieChart, BarChart, Reference
 from collections import defaultdict, Counter
 import re
+import json
+import operator
+import glob
+import time
+import threading
+import argparse
+import io
+import codecs
+import zipfile
+import sqlite3
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from applicant_report import EXPERIENCE_LEVELS, EXPERIENCE_LEVELS_SHORT, classify_expertise, analytics_artifact_path
 
 # File paths
 input_tsv = r"C:\Users\ebarthel3\Desktop\STING 7.0\test-file.tsv"
@@ -34,10 +53,8 @@ def sanitize_text(text):
     
     return text
 
-def extract_themes(text_list, max_themes=5):
-    """Extract common themes/words from a list of text responses"""
-    if not text_list:
-        return []
+def count_theme_words(text_list):
+    """Count candidate theme words (stop words and short words removed) across responses"""
     
     # Stop words to exclude
     stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
@@ -56,152 +73,622 @@ def extract_themes(text_list, max_themes=5):
             words = re.findall(r'\b[a-z]+\b', text.lower())
             all_words.extend([w for w in words if w not in stop_words and len(w) > 3])
     
-    # Count word frequency
-    word_counts = Counter(all_words)
-    return word_counts.most_common(max_themes)
-
-def extract_expertise_areas(background_list):
-    """Extract expertise categories from background text"""
-    expertise_keywords = {
-        'AI/Machine Learning': ['ai', 'ml', 'machine learning', 'artificial intelligence', 'deep learning', 'neural', 'llm'],
-        'Engineering': ['engineering', 'engineer', 'aerospace', 'systems', 'electrical', 'mechanical', 'software', 'hardware'],
-        'Design (HCD/UX)': ['design', 'human-centered', 'ux', 'user experience', 'industrial', 'hcd'],
-        'Cybersecurity': ['cybersecurity', 'security', 'cyber', 'encryption'],
-        'Data Science': ['data', 'analytics', 'analysis', 'database', 'statistical'],
-        'Research': ['research', 'researcher'],
-        'Leadership/Management': ['manager', 'lead', 'officer', 'director', 'management', 'leadership'],
-        'Military': ['military', 'marine', 'army', 'navy', 'air force', 'infantry', 'commissioned'],
-        'Policy/Government': ['policy', 'government', 'federal', 'political'],
-    }
+    return Counter(all_words)
+
+# ===== INPUT DECODING =====
+# Byte-order marks, longest first (UTF-32 LE starts with the UTF-16 LE mark)
+BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+EXPORT_EXTENSIONS = ('.tsv', '.csv', '.txt')
+
+# Read buffer for the byte stream under the decoder
+READ_BUFFER_SIZE = 1024 * 1024
+
+def detect_encoding(head):
+    """Guess the text encoding of an export from its first bytes"""
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding
+    
+    # No BOM: UTF-16 text without a mark still shows NUL bytes in every other position
+    if len(head) >= 4:
+        if head[1::2].count(0) > len(head) // 4:
+            return 'utf-16-le'
+        if head[0::2].count(0) > len(head) // 4:
+            return 'utf-16-be'
+    
+    try:
+        head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the end of the sample is still UTF-8
+        if e.start < len(head) - 3:
+            return 'cp1252'
+    return 'utf-8'
+
+def detect_delimiter(first_line):
+    """Qualtrics exports are tab- or comma-delimited; the ID header row tells which"""
+    return '\t' if first_line.count('\t') >= first_line.count(',') and '\t' in first_line else ','
+
+def iter_rows_from_stream(raw):
+    """Decode a binary export stream and yield parsed rows"""
+    if not hasattr(raw, 'peek'):
+        raw = io.BufferedReader(raw, buffer_size=READ_BUFFER_SIZE)
+    encoding = detect_encoding(raw.peek(4096)[:4096])
+    text = io.TextIOWrapper(raw, encoding=encoding, newline='')
+    
+    first_line = text.readline()
+    delimiter = detect_delimiter(first_line)
+    yield from csv.reader(io.StringIO(first_line), delimiter=delimiter)
+    yield from csv.reader(text, delimiter=delimiter)
+
+def iter_export_rows(file_path):
+    """
+    Yield rows from a Qualtrics export without converting it first:
+    - UTF-16 (Qualtrics TSV default), UTF-8 with or without BOM, detected from the first bytes
+    - tab- or comma-delimited
+    - .zip archives: export members are streamed straight from the archive;
+      with several members, header rows (0-2) of the later ones are skipped
+    """
+    if zipfile.is_zipfile(file_path):
+        with zipfile.ZipFile(file_path) as archive:
+            members = sorted(name for name in archive.namelist()
+                             if name.lower().endswith(EXPORT_EXTENSIONS) and not name.endswith('/'))
+            if not members:
+                print(f"Error: No .tsv/.csv export found in {file_path}")
+                return
+            for member_idx, member in enumerate(members):
+                with archive.open(member) as raw:
+                    for row_idx, row in enumerate(iter_rows_from_stream(raw)):
+                        if member_idx > 0 and row_idx < 3:
+                            continue
+                        yield row
+    else:
+        with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as raw:
+            yield from iter_rows_from_stream(raw)
+
+# Rating scale mappings
+FAMILIARITY_SCALE = {
+    '1': 'Not familiar at all',
+    '2': 'Slightly familiar',
+    '3': 'Moderately familiar',
+    '4': 'Very familiar',
+    '5': 'Extremely familiar'
+}
+
+# Survey layout, resolved by question ID against header row 0 once per file.
+# For a new survey version adjust these, or pass --schema with a JSON file of overrides.
+SURVEY_SCHEMA = {
+    'name_question': 'Q3',                # "What is your name?"
+    'lab_question': 'Q4',                 # "Which unit are you a part of?"
+    'skip_questions': ['Source', 'Q40'],  # Q40 is supervisor email
+    'value_scales': {'Q25_1': 'familiarity', 'Q25_2': 'familiarity'},
+}
+
+# Scales that SURVEY_SCHEMA['value_scales'] can refer to by name
+VALUE_SCALES = {
+    'familiarity': FAMILIARITY_SCALE
+}
+
+def load_survey_schema(path):
+    """Read a JSON file of schema overrides on top of SURVEY_SCHEMA"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return {**SURVEY_SCHEMA, **json.load(f)}
+
+def is_question_id(qid):
+    """Qualtrics question columns are Q<n>...; Q_ prefixes are survey metadata"""
+    return qid.startswith('Q') and not qid.startswith('Q_')
+
+def resolve_questions(question_ids, question_texts, skip_questions=SURVEY_SCHEMA['skip_questions']):
+    """
+    Locate the question columns in the two header rows, in column order:
+    every column from the first question ID on (embedded data and Q_ columns
+    after the questions included), except skipped IDs and columns without
+    text. A repeated ID keeps only its first column.
+    Returns the list of questions, or None if no question columns exist.
+    """
+    start = next((i for i, qid in enumerate(question_ids) if is_question_id(qid)), None)
+    if start is None:
+        return None
+    
+    skip_questions = set(skip_questions)
+    seen = set()
+    questions = []
+    for i in range(start, min(len(question_ids), len(question_texts))):
+        qid = question_ids[i]
+        qtext = question_texts[i]
+        
+        # Skip metadata fields (e.g. supervisor email), repeated IDs and empty columns
+        if qid in skip_questions or qid in seen:
+            continue
+        seen.add(qid)
+        if not qtext or not qtext.strip():
+            continue
+        
+        questions.append({
+            'id': qid,
+            'text': qtext,
+            'column_index': i
+        })
     
-    expertise_counts = defaultdict(int)
+    return questions or None
+
+def clean_response(value):
+    """Trim a raw cell; empty cells become "[No response]" """
+    value = value.strip()
+    return sanitize_text(value) if value else "[No response]"
+
+def scaled_response(scale):
+    """clean_response that first maps scale codes (e.g. '1'..'5') to their labels"""
+    def transform(value):
+        value = value.strip()
+        return sanitize_text(scale.get(value, value)) if value else "[No response]"
+    return transform
+
+class ExtractionPlan:
+    """
+    Row projection compiled once from the header: one itemgetter call pulls the
+    name, lab and every question cell out of a row (in any column order), then
+    each cell goes through its column's transform.
+    """
     
-    for text in background_list:
-        if text and text.strip() and '[NO RESPONSE]' not in text.upper():
-            text_lower = text.lower()
-            for category, keywords in expertise_keywords.items():
-                for keyword in keywords:
-                    if keyword in text_lower:
-                        expertise_counts[category] += 1
-                        break  # Count each category only once per applicant
+    def __init__(self, questions, name_col, lab_col, transforms):
+        self.questions = questions
+        self.transforms = transforms
+        self.has_lab = lab_col is not None
+        columns = [name_col, lab_col if self.has_lab else name_col] + [q['column_index'] for q in questions]
+        self.width = max(columns) + 1
+        self.project = operator.itemgetter(*columns)
+    
+    def extract(self, row):
+        """Returns (name, lab, [response per question]) or None for rows without a name"""
+        if len(row) < self.width:
+            row = list(row) + [""] * (self.width - len(row))
+        name, lab, *cells = self.project(row)
+        
+        name = name.strip()
+        if not name:
+            return None
+        lab = (lab.strip() if self.has_lab else "") or "Unknown"
+        
+        return name, lab, [transform(cell) for transform, cell in zip(self.transforms, cells)]
+
+def compile_extraction_plan(question_ids, question_texts, schema=SURVEY_SCHEMA):
+    """
+    Resolve the schema's columns by question ID and validate them.
+    Returns an ExtractionPlan, or None (after printing why) if the header doesn't fit.
+    """
+    questions = resolve_questions(question_ids, question_texts, schema['skip_questions'])
+    if questions is None:
+        print("Error: Could not find question columns")
+        return None
     
-    return expertise_counts
+    columns = {}
+    for i, qid in enumerate(question_ids):
+        if qid in columns:
+            print(f"Warning: question ID {qid} appears more than once; using the first column")
+            continue
+        columns[qid] = i
+    
+    name_col = columns.get(schema['name_question'])
+    if name_col is None:
+        print(f"Error: name question {schema['name_question']} not found in the header")
+        return None
+    
+    lab_col = columns.get(schema['lab_question'])
+    if lab_col is None:
+        print(f"Warning: unit question {schema['lab_question']} not found; every applicant's lab will be 'Unknown'")
+    
+    unknown_scales = sorted(set(schema['value_scales'].values()) - set(VALUE_SCALES))
+    if unknown_scales:
+        print(f"Error: unknown value scale(s): {', '.join(unknown_scales)}")
+        return None
+    missing = sorted(set(schema['value_scales']) - set(columns))
+    if missing:
+        print(f"Warning: scaled question(s) not in the header: {', '.join(missing)}")
+    
+    scale_transforms = {name: scaled_response(scale) for name, scale in VALUE_SCALES.items()}
+    transforms = [scale_transforms[schema['value_scales'][q['id']]] if q['id'] in schema['value_scales'] else clean_response
+                  for q in questions]
+    
+    return ExtractionPlan(questions, name_col, lab_col, transforms)
 
-def parse_qualtrics_tsv(file_path):
+def extract_qualtrics_records(file_path, schema=SURVEY_SCHEMA):
     """
-    Parse Qualtrics TSV export format:
+    Parse Qualtrics export format (TSV or CSV, optionally zipped; see iter_export_rows):
     - Row 0: Question IDs (Q3, Q20, etc.)
     - Row 1: Full question text
     - Row 2: Import metadata (skip)
     - Row 3+: Applicant responses (one row per applicant)
+    Returns (questions, records) with one (name, lab, responses) record per
+    named row, in export order, or (None, None).
     """
-    
-    # Rating scale mappings
-    familiarity_scale = {
-        '1': 'Not familiar at all',
-        '2': 'Slightly familiar',
-        '3': 'Moderately familiar',
-        '4': 'Very familiar',
-        '5': 'Extremely familiar'
-    }
-    
-    with open(file_path, 'r', encoding='utf-16') as f:
-        reader = csv.reader(f, delimiter='\t')
-        lines = list(reader)
+    lines = list(iter_export_rows(file_path))
     
     if len(lines) < 4:
         print("Error: TSV file doesn't have enough rows")
-        return None, None, None
+        return None, None
     
     question_ids = lines[0]
     question_texts = lines[1]
     # Skip row 2 (import metadata)
     data_rows = lines[3:]  # Start from row 3
     
-    # Find the starting column for questions (after metadata columns)
-    # Typically starts at column 17 with Q3
-    question_start_col = None
-    for i, qid in enumerate(question_ids):
-        if qid.startswith('Q') and not qid.startswith('Q_'):
-            question_start_col = i
-            break
+    plan = compile_extraction_plan(question_ids, question_texts, schema)
+    if plan is None:
+        return None, None
+    questions = plan.questions
     
-    if question_start_col is None:
-        print("Error: Could not find question columns")
-        return None, None, None
+    print(f"Found {len(data_rows)} applicants")
+    print(f"Found {len(questions)} questions")
     
-    # Extract questions (exclude Source and supervisor email)
-    questions = []
-    for i in range(question_start_col, len(question_texts)):
-        qid = question_ids[i]
-        qtext = question_texts[i]
+    records = [record for record in map(plan.extract, data_rows) if record is not None]
+    return questions, records
+
+def build_applicants(questions, records):
+    """applicants and labs dicts from extracted records (a repeated name keeps its last responses)"""
+    applicants = {}
+    labs = defaultdict(list)
+    
+    for applicant_name, lab, responses in records:
+        labs[lab].append(applicant_name)
+        applicants[applicant_name] = {q['text']: response for q, response in zip(questions, responses)}
+    
+    return applicants, dict(labs)
+
+def parse_qualtrics_tsv(file_path, schema=SURVEY_SCHEMA, cache_dir=None):
+    """
+    Parse an export into (applicants, questions, labs).
+    With cache_dir, the extracted records are read from / written to the parse cache.
+    """
+    questions = records = None
+    if cache_dir:
+        key = parse_cache_key(file_path, schema)
+        questions, records = read_parse_cache(cache_dir, key)
+        if records is not None:
+            print(f"Loaded {len(records)} applicants and {len(questions)} questions from parse cache")
+    
+    if records is None:
+        questions, records = extract_qualtrics_records(file_path, schema)
+        if records is None:
+            return None, None, None
+        if cache_dir:
+            write_parse_cache(cache_dir, key, questions, records)
+    
+    applicants, labs = build_applicants(questions, records)
+    return applicants, questions, labs
+
+# ===== PARSE CACHE =====
+# Extracted records of an export, keyed by a hash of its bytes, PARSER_VERSION
+# and the schema, so re-running on an unchanged export skips decoding and
+# normalization. An entry is a directory holding every string of the records
+# as one UTF-8 array with byte offsets (NumPy .npy, memory-mapped on load so
+# each string is decoded from the mapped bytes) and a JSON header with the
+# questions.
+
+# Bump whenever extraction or normalization output changes, to retire old entries
+PARSER_VERSION = 3
+
+PARSE_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'sting-parse-cache')
+
+# Entries kept; the least recently used beyond this are removed
+PARSE_CACHE_ENTRIES = 8
+
+def parse_cache_key(file_path, schema=SURVEY_SCHEMA):
+    """Hex digest of the export's content, the parser version, the schema and its scales"""
+    digest = hashlib.sha256()
+    settings = {'parser_version': PARSER_VERSION, 'schema': schema, 'value_scales': VALUE_SCALES}
+    digest.update(json.dumps(settings, sort_keys=True).encode('utf-8'))
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(READ_BUFFER_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def read_parse_cache(cache_dir, key):
+    """(questions, records) from a cache entry, or (None, None) if there is no usable one"""
+    entry = os.path.join(cache_dir, key)
+    try:
+        with open(os.path.join(entry, 'header.json'), 'r', encoding='utf-8') as f:
+            header = json.load(f)
+        if header.get('parser_version') != PARSER_VERSION:
+            return None, None
+        chars = np.load(os.path.join(entry, 'strings.npy'), mmap_mode='r')
+        offsets = np.load(os.path.join(entry, 'offsets.npy')).tolist()
+        # Decoded string by string from the mapping; the array is never copied whole
+        with memoryview(chars) as data:
+            strings = [str(data[start:end], 'utf-8', 'surrogatepass') for start, end in zip(offsets, offsets[1:])]
+        os.utime(entry)  # recently used
+    except FileNotFoundError:
+        return None, None
+    except (OSError, ValueError, EOFError):
+        shutil.rmtree(entry, ignore_errors=True)  # damaged; rewritten after this parse
+        return None, None
+    
+    width = 2 + len(header['questions'])
+    if len(strings) != width * header['records']:
+        shutil.rmtree(entry, ignore_errors=True)
+        return None, None
+    records = [(strings[i], strings[i + 1], strings[i + 2:i + width]) for i in range(0, len(strings), width)]
+    return header['questions'], records
+
+def write_parse_cache(cache_dir, key, questions, records):
+    """Store extracted records under key; a failed write only costs the next run a parse"""
+    encoded = [s.encode('utf-8', errors='surrogatepass') for name, lab, responses in records for s in (name, lab, *responses)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    chars = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    header = {'parser_version': PARSER_VERSION, 'records': len(records), 'questions': questions}
+    
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Written to a scratch directory and renamed into place, so readers never see half an entry
+        scratch = tempfile.mkdtemp(prefix=f'.{key}-', dir=cache_dir)
+        try:
+            np.save(os.path.join(scratch, 'strings.npy'), chars)
+            np.save(os.path.join(scratch, 'offsets.npy'), offsets)
+            with open(os.path.join(scratch, 'header.json'), 'w', encoding='utf-8') as f:
+                json.dump(header, f)
+            os.replace(scratch, os.path.join(cache_dir, key))
+        except OSError:
+            shutil.rmtree(scratch, ignore_errors=True)
+            if not os.path.isdir(os.path.join(cache_dir, key)):  # lost a race to another writer otherwise
+                raise
+        prune_parse_cache(cache_dir)
+    except OSError as e:
+        print(f"Warning: could not write parse cache in {cache_dir}: {e}")
+
+def prune_parse_cache(cache_dir, keep=PARSE_CACHE_ENTRIES):
+    """Remove all but the `keep` most recently used entries"""
+    entries = [entry for entry in os.scandir(cache_dir) if entry.is_dir() and not entry.name.startswith('.')]
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[keep:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+FAMILIARITY_SCORES = {
+    'Not familiar at all': 1,
+    'Slightly familiar': 2,
+    'Moderately familiar': 3,
+    'Very familiar': 4,
+    'Extremely familiar': 5
+}
+
+MILITARY_KEYWORDS = ['military', 'marine', 'army', 'navy', 'officer', 'infantry', 'manager', 'lead', 'leadership', 'director', 'commissioned']
+
+RESEARCH_KEYWORDS = {
+    'AI/ML': ['ai', 'machine learning', 'neural', 'deep learning', 'llm'],
+    'Human-Centered Design': ['human-centered', 'hcd', 'user research', 'user experience'],
+    'Systems Engineering': ['systems', 'engineering', 'integration'],
+    'Policy': ['policy', 'governance', 'political'],
+    'Sustainability': ['sustainability', 'environment', 'climate'],
+    'Social Impact': ['social', 'community', 'equity', 'public']
+}
+
+# Themes extracted from free-text questions: key -> (question ID, number of themes)
+THEME_QUESTIONS = {
+    'challenges': ('Q33', 5),
+    'motivations': ('Q21', 5),
+    'strengths': ('Q18', 6),
+}
+
+# Applicants per text-analytics task in process_tsv's worker pool
+TEXT_ANALYTICS_CHUNK = 500
+
+class TextAnalytics:
+    """
+    The free-text part of the Summary-sheet analyses: theme words (Q33/Q21/Q18),
+    expertise classification (Q22) and the military/research keyword scans.
+    Partial results for consecutive chunks of applicants merge() in order into
+    exactly what one pass would give, so chunks can run in worker processes.
+    """
+    
+    def __init__(self, question_ids):
+        self.question_ids = question_ids
+        self.theme_words = {key: Counter() for key in THEME_QUESTIONS}
+        self.expertise = Counter()
+        self.military_applicants = []
+        self.research_counts = Counter()
+    
+    def add(self, name, responses):
+        # Qualitative themes
+        for key, (question_id, _) in THEME_QUESTIONS.items():
+            response = responses.get(question_id, '')
+            if response and '[No response]' not in response:
+                self.theme_words[key].update(count_theme_words([response]))
         
-        # Skip metadata fields
-        if qid in ['Source', 'Q40']:  # Q40 is supervisor email
-            continue
+        # Capability inventory
+        background = responses.get('Q22', '')
+        selection = responses.get('Q18', '')
+        if background and '[No response]' not in background:
+            for category in classify_expertise(background):
+                self.expertise[category] += 1
         
-        # Skip empty columns
-        if not qtext or not qtext.strip():
-            continue
+        text = (background + " " + selection).lower()
+        if 'Q22' in self.question_ids and 'Q18' in self.question_ids:
+            if any(keyword in text for keyword in MILITARY_KEYWORDS):
+                self.military_applicants.append(name)
         
-        questions.append({
-            'id': qid,
-            'text': qtext,
-            'column_index': i
-        })
+        for category, keywords in RESEARCH_KEYWORDS.items():
+            for keyword in keywords:
+                if keyword in text:
+                    self.research_counts[category] += 1
+                    break
     
-    print(f"Found {len(data_rows)} applicants")
-    print(f"Found {len(questions)} questions")
+    def merge(self, other):
+        """Fold in the partial result of the next chunk"""
+        for key, counts in other.theme_words.items():
+            self.theme_words[key].update(counts)
+        self.expertise.update(other.expertise)
+        self.military_applicants.extend(other.military_applicants)
+        self.research_counts.update(other.research_counts)
+
+def text_analytics_chunk(question_ids, records):
+    """Worker-process task: TextAnalytics over a list of (name, responses by ID)"""
+    partial = TextAnalytics(question_ids)
+    for name, responses in records:
+        partial.add(name, responses)
+    return partial
+
+class SummaryAccumulator:
+    """
+    Incremental form of the Summary-sheet analyses. Applicants are added one at
+    a time (responses keyed by question ID), so the analyses can run over a
+    stream of records as well as an in-memory dict; result() returns the same
+    JSON-serializable dict either way.
     
-    # Build applicant dictionary
-    applicants = {}
-    labs = defaultdict(list)
+    Pass text=False to add() to leave out the free-text analyses and merge
+    their results in separately (see process_tsv).
+    """
     
-    for row in data_rows:
-        if len(row) <= question_start_col:
-            continue
+    def __init__(self, questions):
+        self.question_ids = {q['id'] for q in questions}
+        self.total_questions = len(questions)
+        self.familiarity_questions = [q for q in questions if q['id'] in ['Q25_1', 'Q25_2']]
         
-        # Get applicant name (usually first question)
-        name_col = questions[0]['column_index']
-        applicant_name = row[name_col] if len(row) > name_col else ""
+        self.total_applicants = 0
+        self.labs = defaultdict(list)
+        self.exp_counts = defaultdict(int)
+        self.exp_by_lab = defaultdict(lambda: defaultdict(int))
+        self.familiarity_scores = defaultdict(list)
+        self.workshop = {'Can attend all': 0, 'Has conflicts': 0}
+        self.text = TextAnalytics(self.question_ids)
+    
+    def add(self, name, lab, responses, text=True):
+        """Fold one applicant into the running analyses"""
+        self.total_applicants += 1
+        self.labs[lab].append(name)
         
-        if not applicant_name or not applicant_name.strip():
-            continue
+        # Experience level distribution and experience-by-lab cross-tab
+        exp_level = responses.get('Q24', '')
+        if exp_level and exp_level != '[No response]':
+            self.exp_counts[exp_level] += 1
+        self.exp_by_lab[lab][exp_level] += 1
+        
+        # Familiarity ratings (Q25_1, Q25_2)
+        for q in self.familiarity_questions:
+            response = responses.get(q['id'], '')
+            if response and response != '[No response]':
+                score = FAMILIARITY_SCORES.get(response, None)
+                if score:
+                    self.familiarity_scores[q['id']].append(score)
+        
+        # Workshop attendance (Q30): an empty or N/A answer means no conflicts
+        if 'Q30' in self.question_ids:
+            response = responses.get('Q30', '')
+            if not response or response.strip().upper() in ['N/A', '[NO RESPONSE]', '']:
+                self.workshop['Can attend all'] += 1
+            else:
+                self.workshop['Has conflicts'] += 1
         
-        applicant_name = applicant_name.strip()
-        applicants[applicant_name] = {}
+        if text:
+            self.text.add(name, responses)
+    
+    def result(self):
+        """The analytics dict consumed by create_summary_sheet and the dashboard"""
+        analytics = {
+            'total_applicants': self.total_applicants,
+            'total_questions': self.total_questions,
+            'generated': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        
+        # Unit/lab breakdown, largest first
+        analytics['labs'] = [
+            {'lab': lab, 'count': len(self.labs[lab]), 'applicants': sorted(self.labs[lab])}
+            for lab in sorted(self.labs.keys(), key=lambda x: len(self.labs[x]), reverse=True)
+        ]
         
-        # Extract lab/unit from column 19 (Q4 - "Which unit are you part of?")
-        lab_col = 19
-        lab = row[lab_col] if len(row) > lab_col else "Unknown"
-        if lab and lab.strip():
-            labs[lab.strip()].append(applicant_name)
+        if 'Q24' in self.question_ids:
+            analytics['experience'] = [{'level': level, 'count': self.exp_counts.get(level, 0)} for level in EXPERIENCE_LEVELS]
+            analytics['experience_by_lab'] = [
+                {'lab': lab, 'counts': [self.exp_by_lab[lab].get(level, 0) for level in EXPERIENCE_LEVELS]}
+                for lab in sorted(self.labs.keys())
+            ]
         else:
-            labs["Unknown"].append(applicant_name)
+            analytics['experience'] = None
+            analytics['experience_by_lab'] = None
         
-        # Extract all responses for this applicant
-        for q in questions:
-            col_idx = q['column_index']
-            response = row[col_idx] if len(row) > col_idx else ""
-            
-            # Handle empty responses
-            if not response or not response.strip():
-                response = "[No response]"
-            else:
-                response = response.strip()
-                
-                # Map numeric ratings to descriptive text for familiarity questions (Q25_1, Q25_2)
-                if q['id'] in ['Q25_1', 'Q25_2'] and response in familiarity_scale:
-                    response = familiarity_scale[response]
-                
-                response = sanitize_text(response)
-            
-            applicants[applicant_name][q['text']] = response
-    
-    return applicants, questions, dict(labs)
+        analytics['familiarity'] = []
+        for q in self.familiarity_questions:
+            scores = self.familiarity_scores.get(q['id'])
+            if scores:
+                analytics['familiarity'].append({
+                    'question_id': q['id'],
+                    'question': q['text'],
+                    'average': sum(scores) / len(scores),
+                    'responses': len(scores)
+                })
+        
+        analytics['workshop'] = dict(self.workshop) if 'Q30' in self.question_ids else None
+        
+        text = self.text
+        analytics['themes'] = {
+            key: ([list(theme) for theme in text.theme_words[key].most_common(max_themes)]
+                  if question_id in self.question_ids else None)
+            for key, (question_id, max_themes) in THEME_QUESTIONS.items()
+        }
+        
+        if 'Q22' in self.question_ids:
+            analytics['expertise'] = [[category, text.expertise[category]]
+                                      for category in sorted(text.expertise.keys(), key=lambda x: text.expertise[x], reverse=True)]
+        else:
+            analytics['expertise'] = None
+        
+        analytics['military_leadership'] = sorted(text.military_applicants)
+        analytics['research_focus'] = [[category, text.research_counts[category]]
+                                       for category in sorted(text.research_counts.keys(), key=lambda x: text.research_counts[x], reverse=True)
+                                       if text.research_counts[category] > 0]
+        
+        return analytics
 
-def create_summary_sheet(writer, applicants, questions, labs):
-    """Create comprehensive summary sheet with all analyses"""
+def write_analytics_artifact(analytics, path):
+    """Write the summary analytics as JSON for the dashboard's Applicant Pool tab"""
+    tmp_path = temp_output_path(path)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(analytics, f, indent=2)
+    os.replace(tmp_path, path)
+
+# ===== REPORT STYLES =====
+def solid_fill(color):
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+# Every styled cell uses one of these NamedStyles: they're registered once per
+# workbook and applied by name, so the workbook holds one style record per
+# format instead of new Font/Fill/Alignment objects for every cell
+REPORT_STYLES = {
+    'Report Header': {'font': Font(bold=True, size=11), 'fill': solid_fill("D3D3D3")},
+    'Applicant Header': {'font': Font(bold=True, size=11), 'fill': solid_fill("D3D3D3"),
+                         'alignment': Alignment(horizontal="left", vertical="top")},
+    'Section Title': {'font': Font(bold=True, size=12, color="FFFFFF"), 'fill': solid_fill("4472C4")},
+    'Qualitative Title': {'font': Font(bold=True, size=12, color="FFFFFF"), 'fill': solid_fill("C65911")},
+    'Inventory Title': {'font': Font(bold=True, size=12, color="FFFFFF"), 'fill': solid_fill("70AD47")},
+    'Table Header': {'font': Font(bold=True, color="FFFFFF"), 'fill': solid_fill("70AD47")},
+    'Sub Header': {'font': Font(bold=True, size=11)},
+    'Wrapped': {'font': DEFAULT_FONT, 'alignment': Alignment(wrap_text=True)},
+    'Wrapped Body': {'font': DEFAULT_FONT, 'alignment': Alignment(wrap_text=True, vertical='top')},
+}
+
+# Applicant sheet rows: body rows use the sheet default, the header keeps the normal height
+RESPONSE_ROW_HEIGHT = 30
+HEADER_ROW_HEIGHT = 15
+
+def register_report_styles(workbook):
+    """Add REPORT_STYLES to a workbook; safe to call more than once"""
+    for name, attributes in REPORT_STYLES.items():
+        if name not in workbook.style_names:
+            workbook.add_named_style(NamedStyle(name=name, **attributes))
+
+def set_response_row_heights(worksheet):
+    """Give every row the response height through the sheet default instead of one entry per row"""
+    worksheet.sheet_format.defaultRowHeight = RESPONSE_ROW_HEIGHT
+    worksheet.sheet_format.customHeight = True
+    worksheet.row_dimensions[1].height = HEADER_ROW_HEIGHT
+
+def create_summary_sheet(writer, analytics):
+    """Create (or fill in a reserved) comprehensive summary sheet with all analyses"""
     summary_data = {
         'Metric': [
             'Total Applicants',
@@ -209,47 +696,49 @@ def create_summary_sheet(writer, applicants, questions, labs):
             'Report Generated'
         ],
         'Value': [
-            len(applicants),
-            len(questions),
-            pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+            analytics['total_applicants'],
+            analytics['total_questions'],
+            analytics['generated']
         ]
     }
-    summary_df = pd.DataFrame(summary_data)
-    summary_df.to_excel(writer, sheet_name='Summary', index=False, startrow=0)
     
-    worksheet = writer.sheets['Summary']
+    # Write straight to the workbook like create_applicant_sheets: process_tsv fills
+    # the Summary in after the applicant sheets, where every pandas sheet lookup is slow
+    book = writer.book
+    worksheet = book['Summary'] if 'Summary' in book.sheetnames else book.create_sheet('Summary')
+    worksheet.append(list(summary_data))
+    for row in zip(*summary_data.values()):
+        worksheet.append(row)
+    
+    register_report_styles(book)
     worksheet.column_dimensions['A'].width = 40
     worksheet.column_dimensions['B'].width = 60
     
     for cell in worksheet[1]:
-        cell.font = Font(bold=True, size=11)
-        cell.fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
+        cell.style = 'Report Header'
     
     startrow = 6
     
     # ===== UNIT/LAB BREAKDOWN =====
     ws_title = worksheet[f'A{startrow}']
     ws_title.value = 'Unit/Lab Participation Breakdown'
-    ws_title.font = Font(bold=True, size=12, color="FFFFFF")
-    ws_title.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    ws_title.style = 'Section Title'
     startrow += 1
     
     headers = ['Lab/Unit', 'Count', 'Applicants']
     for col_idx, header in enumerate(headers, 1):
         cell = worksheet.cell(row=startrow, column=col_idx)
         cell.value = header
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+        cell.style = 'Table Header'
     
     startrow += 1
     lab_start = startrow
     
-    for lab in sorted(labs.keys(), key=lambda x: len(labs[x]), reverse=True):
-        applicant_list = labs[lab]
-        worksheet.cell(row=startrow, column=1).value = lab
-        worksheet.cell(row=startrow, column=2).value = len(applicant_list)
-        worksheet.cell(row=startrow, column=3).value = ', '.join(sorted(applicant_list))
-        worksheet.cell(row=startrow, column=3).alignment = Alignment(wrap_text=True)
+    for lab in analytics['labs']:
+        worksheet.cell(row=startrow, column=1).value = lab['lab']
+        worksheet.cell(row=startrow, column=2).value = lab['count']
+        worksheet.cell(row=startrow, column=3).value = ', '.join(lab['applicants'])
+        worksheet.cell(row=startrow, column=3).style = 'Wrapped'
         startrow += 1
     
     lab_end = startrow - 1
@@ -269,37 +758,21 @@ def create_summary_sheet(writer, applicants, questions, labs):
     # ===== EXPERIENCE LEVEL DISTRIBUTION =====
     exp_title = worksheet[f'A{startrow}']
     exp_title.value = 'Experience Level Distribution'
-    exp_title.font = Font(bold=True, size=12, color="FFFFFF")
-    exp_title.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    exp_title.style = 'Section Title'
     startrow += 1
     
-    exp_question = None
-    for q in questions:
-        if q['id'] == 'Q24':
-            exp_question = q['text']
-            break
-    
-    if exp_question:
-        exp_counts = defaultdict(int)
-        exp_order = ['Entry level (0-2 years)', 'Novice (2-5 years)', 'Intermediate (5-10 years)', 'Advanced (10-15 years)', 'Expert (15+ years)']
-        
-        for applicant_name in applicants.keys():
-            exp_level = applicants[applicant_name].get(exp_question, '')
-            if exp_level and exp_level != '[No response]':
-                exp_counts[exp_level] += 1
-        
+    if analytics['experience'] is not None:
         worksheet.cell(row=startrow, column=1).value = 'Experience Level'
         worksheet.cell(row=startrow, column=2).value = 'Count'
         for cell in [worksheet.cell(row=startrow, column=1), worksheet.cell(row=startrow, column=2)]:
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+            cell.style = 'Table Header'
         
         startrow += 1
         exp_data_start = startrow
         
-        for exp_level in exp_order:
-            worksheet.cell(row=startrow, column=1).value = exp_level
-            worksheet.cell(row=startrow, column=2).value = exp_counts.get(exp_level, 0)
+        for exp in analytics['experience']:
+            worksheet.cell(row=startrow, column=1).value = exp['level']
+            worksheet.cell(row=startrow, column=2).value = exp['count']
             startrow += 1
         
         exp_data_end = startrow - 1
@@ -320,60 +793,36 @@ def create_summary_sheet(writer, applicants, questions, labs):
     # ===== FAMILIARITY RATINGS =====
     fam_title = worksheet[f'A{startrow}']
     fam_title.value = 'Familiarity Ratings Analysis'
-    fam_title.font = Font(bold=True, size=12, color="FFFFFF")
-    fam_title.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    fam_title.style = 'Section Title'
     startrow += 1
     
-    fam_scale_reverse = {
-        'Not familiar at all': 1,
-        'Slightly familiar': 2,
-        'Moderately familiar': 3,
-        'Very familiar': 4,
-        'Extremely familiar': 5
-    }
-    
-    for q in questions:
-        if q['id'] in ['Q25_1', 'Q25_2']:
-            scores = []
-            for applicant_name in applicants.keys():
-                response = applicants[applicant_name].get(q['text'], '')
-                if response and response != '[No response]':
-                    score = fam_scale_reverse.get(response, None)
-                    if score:
-                        scores.append(score)
-            
-            if scores:
-                avg_score = sum(scores) / len(scores)
-                label = q['text'][:60]
-                worksheet.cell(row=startrow, column=1).value = f"{label} (Avg: {avg_score:.2f}/5)"
-                startrow += 1
+    for fam in analytics['familiarity']:
+        label = fam['question'][:60]
+        worksheet.cell(row=startrow, column=1).value = f"{label} (Avg: {fam['average']:.2f}/5)"
+        startrow += 1
     
     startrow += 1
     
     # ===== EXPERIENCE BY LAB MATRIX =====
     matrix_title = worksheet[f'A{startrow}']
     matrix_title.value = 'Experience by Lab (Cross-Tab)'
-    matrix_title.font = Font(bold=True, size=12, color="FFFFFF")
-    matrix_title.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    matrix_title.style = 'Section Title'
     startrow += 1
     
-    if exp_question:
-        exp_levels_short = ['Entry', 'Novice', 'Intermediate', 'Advanced', 'Expert']
+    if analytics['experience_by_lab'] is not None:
         worksheet.cell(row=startrow, column=1).value = 'Lab'
-        for i, exp in enumerate(exp_levels_short, 2):
+        for i, exp in enumerate(EXPERIENCE_LEVELS_SHORT, 2):
             worksheet.cell(row=startrow, column=i).value = exp
         
         for cell in worksheet.iter_rows(min_row=startrow, max_row=startrow, min_col=1, max_col=6):
             for c in cell:
-                c.font = Font(bold=True, color="FFFFFF")
-                c.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+                c.style = 'Table Header'
         
         startrow += 1
         
-        for lab in sorted(labs.keys()):
-            worksheet.cell(row=startrow, column=1).value = lab
-            for i, exp_full in enumerate(exp_order, 2):
-                count = sum(1 for applicant in labs[lab] if applicants[applicant].get(exp_question, '') == exp_full)
+        for row in analytics['experience_by_lab']:
+            worksheet.cell(row=startrow, column=1).value = row['lab']
+            for i, count in enumerate(row['counts'], 2):
                 worksheet.cell(row=startrow, column=i).value = count
             startrow += 1
     
@@ -382,42 +831,24 @@ def create_summary_sheet(writer, applicants, questions, labs):
     # ===== WORKSHOP ATTENDANCE =====
     workshop_title = worksheet[f'A{startrow}']
     workshop_title.value = 'Workshop Attendance'
-    workshop_title.font = Font(bold=True, size=12, color="FFFFFF")
-    workshop_title.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    workshop_title.style = 'Section Title'
     startrow += 1
     
-    workshop_question = None
-    for q in questions:
-        if q['id'] == 'Q30':
-            workshop_question = q['text']
-            break
-    
-    if workshop_question:
-        full_attendance = 0
-        conflicts = 0
-        
-        for applicant_name in applicants.keys():
-            response = applicants[applicant_name].get(workshop_question, '')
-            if not response or response.strip().upper() in ['N/A', '[NO RESPONSE]', '']:
-                full_attendance += 1
-            else:
-                conflicts += 1
-        
+    if analytics['workshop'] is not None:
         worksheet.cell(row=startrow, column=1).value = 'Attendance Type'
         worksheet.cell(row=startrow, column=2).value = 'Count'
         for cell in [worksheet.cell(row=startrow, column=1), worksheet.cell(row=startrow, column=2)]:
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+            cell.style = 'Table Header'
         
         startrow += 1
         att_start = startrow
         
         worksheet.cell(row=startrow, column=1).value = 'Can attend all'
-        worksheet.cell(row=startrow, column=2).value = full_attendance
+        worksheet.cell(row=startrow, column=2).value = analytics['workshop']['Can attend all']
         startrow += 1
         
         worksheet.cell(row=startrow, column=1).value = 'Has conflicts'
-        worksheet.cell(row=startrow, column=2).value = conflicts
+        worksheet.cell(row=startrow, column=2).value = analytics['workshop']['Has conflicts']
         att_end = startrow
         
         # Pie chart
@@ -434,110 +865,45 @@ def create_summary_sheet(writer, applicants, questions, labs):
     # ===== QUALITATIVE ANALYSIS =====
     qual_title = worksheet[f'A{startrow}']
     qual_title.value = 'Qualitative Analysis: Themes & Patterns'
-    qual_title.font = Font(bold=True, size=12, color="FFFFFF")
-    qual_title.fill = PatternFill(start_color="C65911", end_color="C65911", fill_type="solid")
+    qual_title.style = 'Qualitative Title'
     startrow += 1
     
-    # Common Challenges (Q33)
-    worksheet.cell(row=startrow, column=1).value = 'Common Challenges (from Q33)'
-    worksheet.cell(row=startrow, column=1).font = Font(bold=True, size=11)
-    startrow += 1
-    
-    challenges_question = None
-    for q in questions:
-        if q['id'] == 'Q33':
-            challenges_question = q['text']
-            break
-    
-    if challenges_question:
-        challenges_responses = [applicants[name].get(challenges_question, '') for name in applicants.keys() 
-                               if applicants[name].get(challenges_question, '') and '[No response]' not in applicants[name].get(challenges_question, '')]
-        challenges = extract_themes(challenges_responses, max_themes=5)
-        if challenges:
-            for theme, count in challenges:
-                worksheet.cell(row=startrow, column=1).value = f"  • {theme.capitalize()} ({count}x)"
-                startrow += 1
-        else:
-            worksheet.cell(row=startrow, column=1).value = "  • No themes extracted"
-            startrow += 1
-    
-    startrow += 1
-    
-    # Motivations/Goals (Q21)
-    worksheet.cell(row=startrow, column=1).value = 'Top Motivations/Goals (from Q21)'
-    worksheet.cell(row=startrow, column=1).font = Font(bold=True, size=11)
-    startrow += 1
-    
-    motivations_question = None
-    for q in questions:
-        if q['id'] == 'Q21':
-            motivations_question = q['text']
-            break
-    
-    if motivations_question:
-        motivations_responses = [applicants[name].get(motivations_question, '') for name in applicants.keys()
-                                if applicants[name].get(motivations_question, '') and '[No response]' not in applicants[name].get(motivations_question, '')]
-        motivations = extract_themes(motivations_responses, max_themes=5)
-        if motivations:
-            for theme, count in motivations:
-                worksheet.cell(row=startrow, column=1).value = f"  • {theme.capitalize()} ({count}x)"
-                startrow += 1
-        else:
-            worksheet.cell(row=startrow, column=1).value = "  • No themes extracted"
-            startrow += 1
-    
-    startrow += 1
-    
-    # Why Select You - Key Strengths (Q18)
-    worksheet.cell(row=startrow, column=1).value = 'Key Strengths Cited (from Q18)'
-    worksheet.cell(row=startrow, column=1).font = Font(bold=True, size=11)
-    startrow += 1
-    
-    selection_question = None
-    for q in questions:
-        if q['id'] == 'Q18':
-            selection_question = q['text']
-            break
-    
-    if selection_question:
-        selection_responses = [applicants[name].get(selection_question, '') for name in applicants.keys()
-                              if applicants[name].get(selection_question, '') and '[No response]' not in applicants[name].get(selection_question, '')]
-        strengths = extract_themes(selection_responses, max_themes=6)
-        if strengths:
-            for theme, count in strengths:
-                worksheet.cell(row=startrow, column=1).value = f"  • {theme.capitalize()} ({count}x)"
+    theme_sections = [
+        ('challenges', 'Common Challenges (from Q33)'),
+        ('motivations', 'Top Motivations/Goals (from Q21)'),
+        ('strengths', 'Key Strengths Cited (from Q18)'),
+    ]
+    for i, (key, heading) in enumerate(theme_sections):
+        worksheet.cell(row=startrow, column=1).value = heading
+        worksheet.cell(row=startrow, column=1).style = 'Sub Header'
+        startrow += 1
+        
+        themes = analytics['themes'][key]
+        if themes is not None:
+            if themes:
+                for theme, count in themes:
+                    worksheet.cell(row=startrow, column=1).value = f"  • {theme.capitalize()} ({count}x)"
+                    startrow += 1
+            else:
+                worksheet.cell(row=startrow, column=1).value = "  • No themes extracted"
                 startrow += 1
-        else:
-            worksheet.cell(row=startrow, column=1).value = "  • No themes extracted"
-            startrow += 1
-    
-    startrow += 2
+        
+        startrow += 2 if i == len(theme_sections) - 1 else 1
     
     # ===== CAPABILITY INVENTORY =====
     inv_title = worksheet[f'A{startrow}']
     inv_title.value = 'Capability Inventory'
-    inv_title.font = Font(bold=True, size=12, color="FFFFFF")
-    inv_title.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+    inv_title.style = 'Inventory Title'
     startrow += 1
     
     # Expertise Areas (Q22)
     worksheet.cell(row=startrow, column=1).value = 'Expertise Areas (from Q22)'
-    worksheet.cell(row=startrow, column=1).font = Font(bold=True, size=11)
+    worksheet.cell(row=startrow, column=1).style = 'Sub Header'
     startrow += 1
     
-    background_question = None
-    for q in questions:
-        if q['id'] == 'Q22':
-            background_question = q['text']
-            break
-    
-    if background_question:
-        background_responses = [applicants[name].get(background_question, '') for name in applicants.keys()
-                               if applicants[name].get(background_question, '') and '[No response]' not in applicants[name].get(background_question, '')]
-        expertise = extract_expertise_areas(background_responses)
-        if expertise:
-            for category in sorted(expertise.keys(), key=lambda x: expertise[x], reverse=True):
-                count = expertise[category]
+    if analytics['expertise'] is not None:
+        if analytics['expertise']:
+            for category, count in analytics['expertise']:
                 worksheet.cell(row=startrow, column=1).value = f"  • {category}: {count} applicant(s)"
                 startrow += 1
         else:
@@ -548,21 +914,11 @@ def create_summary_sheet(writer, applicants, questions, labs):
     
     # Military/Leadership Experience
     worksheet.cell(row=startrow, column=1).value = 'Military/Leadership Experience'
-    worksheet.cell(row=startrow, column=1).font = Font(bold=True, size=11)
+    worksheet.cell(row=startrow, column=1).style = 'Sub Header'
     startrow += 1
     
-    military_keywords = ['military', 'marine', 'army', 'navy', 'officer', 'infantry', 'manager', 'lead', 'leadership', 'director', 'commissioned']
-    military_applicants = []
-    
-    if background_question and selection_question:
-        for name in applicants.keys():
-            text = (applicants[name].get(background_question, '') + " " + 
-                   applicants[name].get(selection_question, '')).lower()
-            if any(keyword in text for keyword in military_keywords):
-                military_applicants.append(name)
-    
-    if military_applicants:
-        for name in sorted(military_applicants):
+    if analytics['military_leadership']:
+        for name in analytics['military_leadership']:
             worksheet.cell(row=startrow, column=1).value = f"  • {name}"
             startrow += 1
     else:
@@ -573,91 +929,83 @@ def create_summary_sheet(writer, applicants, questions, labs):
     
     # Research Focus Areas
     worksheet.cell(row=startrow, column=1).value = 'Research Focus Areas'
-    worksheet.cell(row=startrow, column=1).font = Font(bold=True, size=11)
+    worksheet.cell(row=startrow, column=1).style = 'Sub Header'
     startrow += 1
     
-    research_keywords = {
-        'AI/ML': ['ai', 'machine learning', 'neural', 'deep learning', 'llm'],
-        'Human-Centered Design': ['human-centered', 'hcd', 'user research', 'user experience'],
-        'Systems Engineering': ['systems', 'engineering', 'integration'],
-        'Policy': ['policy', 'governance', 'political'],
-        'Sustainability': ['sustainability', 'environment', 'climate'],
-        'Social Impact': ['social', 'community', 'equity', 'public']
-    }
-    
-    research_counts = defaultdict(int)
-    
-    for name in applicants.keys():
-        bg_text = (applicants[name].get(background_question, '') + " " + 
-                  applicants[name].get(selection_question, '')).lower()
-        for category, keywords in research_keywords.items():
-            for keyword in keywords:
-                if keyword in bg_text:
-                    research_counts[category] += 1
-                    break
-    
-    if research_counts:
-        for category in sorted(research_counts.keys(), key=lambda x: research_counts[x], reverse=True):
-            if research_counts[category] > 0:
-                worksheet.cell(row=startrow, column=1).value = f"  • {category}: {research_counts[category]} applicant(s)"
-                startrow += 1
+    if analytics['research_focus']:
+        for category, count in analytics['research_focus']:
+            worksheet.cell(row=startrow, column=1).value = f"  • {category}: {count} applicant(s)"
+            startrow += 1
     else:
         worksheet.cell(row=startrow, column=1).value = "  • No research focus identified"
         startrow += 1
 
-def create_applicant_sheets(writer, applicants):
+def excel_sheet_name(applicant_name):
+    """Sanitize sheet name - Excel doesn't allow: [ ] : * ? / \\ and max 31 characters"""
+    sheet_name = applicant_name[:31]
+    invalid_chars = ['[', ']', ':', '*', '?', '/', '\\']
+    for char in invalid_chars:
+        sheet_name = sheet_name.replace(char, '')
+    return sheet_name
+
+def create_applicant_sheets(writer, applicants, questions):
     """Create individual sheets for each applicant with all their responses"""
     
+    register_report_styles(writer.book)
+    
+    # Keep question IDs alongside the text so the dashboard can look fields up by ID
+    question_ids = {q['text']: q['id'] for q in questions}
+    
     for applicant_name in sorted(applicants.keys()):
         responses = applicants[applicant_name]
         
-        # Create DataFrame from applicant responses
+        # Sheet columns from the applicant responses
         data = {
+            'Question ID': [question_ids.get(q, '') for q in responses.keys()],
             'Question': list(responses.keys()),
             'Response': list(responses.values())
         }
-        applicant_df = pd.DataFrame(data)
-        
-        # Sanitize sheet name - Excel doesn't allow: [ ] : * ? / \
-        # Also max 31 characters
-        sheet_name = applicant_name[:31]
-        invalid_chars = ['[', ']', ':', '*', '?', '/', '\\']
-        for char in invalid_chars:
-            sheet_name = sheet_name.replace(char, '')
         
-        # Write to sheet
-        applicant_df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=0)
-        
-        # Format the sheet
-        worksheet = writer.sheets[sheet_name]
+        # Write straight to the workbook: pandas' to_excel looks every sheet up
+        # by name on each call, which gets very slow with thousands of sheets
+        worksheet = writer.book.create_sheet(excel_sheet_name(applicant_name))
+        worksheet.append(list(data))
+        for row in zip(*data.values()):
+            worksheet.append(row)
         
         # Format header row
         for cell in worksheet[1]:
-            cell.font = Font(bold=True, size=11)
-            cell.fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
-            cell.alignment = Alignment(horizontal="left", vertical="top")
-        
-        # Auto-adjust column widths and wrap text
-        for col in worksheet.columns:
-            max_length = 0
-            for cell in col:
-                try:
-                    max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 100)
-            worksheet.column_dimensions[col[0].column_letter].width = adjusted_width
-        
-        # Wrap text for responses and set row heights
+            cell.style = 'Applicant Header'
+        
+        # Auto-adjust column widths from the data (header included)
+        for col_letter, (header, values) in zip('ABC', data.items()):
+            max_length = max(len(str(value)) for value in [header] + values)
+            worksheet.column_dimensions[col_letter].width = min(max_length + 2, 100)
+        
+        # Wrap text for responses; row heights come from the sheet default
         for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
             for cell in row:
-                cell.alignment = Alignment(wrap_text=True, vertical='top')
-            # Set minimum row height
-            worksheet.row_dimensions[row[0].row].height = 30
+                cell.style = 'Wrapped Body'
+        set_response_row_heights(worksheet)
+
+def run_text_analytics(executor, question_ids, records, chunk_size=TEXT_ANALYTICS_CHUNK):
+    """Submit TextAnalytics for consecutive chunks; returns futures in applicant order"""
+    return [executor.submit(text_analytics_chunk, question_ids, records[start:start + chunk_size])
+            for start in range(0, len(records), chunk_size)]
 
-def process_tsv(input_tsv, output_file):
+def process_tsv(input_tsv, output_file, workers=None, parse_cache=PARSE_CACHE_DIR):
+    """
+    Build the report in stages: the free-text analytics run in a pool of
+    `workers` processes (default: one per CPU besides this one; 0 runs them
+    here) while this process renders the applicant sheets, and the Summary
+    sheet is filled in once both are done. Exports that fit in one chunk skip
+    the pool, which would cost more to start than it saves. Output is
+    identical either way.
+    Parsed records are reused from the `parse_cache` directory when the
+    export hasn't changed (None to always parse).
+    """
     print("Parsing Qualtrics TSV export...")
-    applicants, questions, labs = parse_qualtrics_tsv(input_tsv)
+    applicants, questions, labs = parse_qualtrics_tsv(input_tsv, cache_dir=parse_cache)
     
     if not applicants:
         print("No applicant data found")
@@ -668,32 +1016,369 @@ def process_tsv(input_tsv, output_file):
     for i, q in enumerate(questions, 1):
         print(f"  {i}. {q['text'][:80]}{'...' if len(q['text']) > 80 else ''}")
     
-    # Delete old file if it exists to avoid permission errors
-    if os.path.exists(output_file):
-        try:
-            os.remove(output_file)
-            print(f"\nRemoved old file: {output_file}")
-        except PermissionError:
-            print(f"\nWarning: Could not delete old file (it may be open). Trying to create backup...")
-            backup_file = output_file.replace('.xlsx', '_backup.xlsx')
-            try:
-                os.rename(output_file, backup_file)
-                print(f"Created backup: {backup_file}")
-            except:
-                print("Error: Cannot write to file. Please close it if it's open in Excel.")
-                return
+    # Summary analyses run over records keyed by question ID, in export order
+    lab_of = {name: lab for lab, names in labs.items() for name in names}
+    records = [(name, {q['id']: responses.get(q['text'], '') for q in questions})
+               for name, responses in applicants.items()]
     
-    # Create Excel report
+    # Build the report under a temporary name and move it into place once complete,
+    # so the dashboard never reads a half-written file
     print("\nCreating Excel report with comprehensive analyses...")
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        create_summary_sheet(writer, applicants, questions, labs)
-        create_applicant_sheets(writer, applicants)
+    accumulator = SummaryAccumulator(questions)
+    tmp_file = temp_output_path(output_file)
+    if workers is None:
+        workers = (os.cpu_count() or 1) - 1
+    use_pool = workers > 0 and len(records) > TEXT_ANALYTICS_CHUNK
+    executor = ProcessPoolExecutor(max_workers=workers) if use_pool else None
+    try:
+        # Stage 1 (worker processes): free-text analytics, in applicant-order chunks
+        text_futures = run_text_analytics(executor, accumulator.question_ids, records) if executor else None
+        
+        # Stage 2 (this process, meanwhile): the remaining analyses and the applicant sheets
+        for name, responses in records:
+            accumulator.add(name, lab_of.get(name, "Unknown"), responses, text=executor is None)
+        
+        with pd.ExcelWriter(tmp_file, engine='openpyxl') as writer:
+            # Reserve the first sheet for the Summary, which needs the analytics
+            writer.book.create_sheet('Summary')
+            create_applicant_sheets(writer, applicants, questions)
+            
+            # Stage 3: merge the text analytics in chunk order and fill in the Summary
+            for future in text_futures or []:
+                accumulator.text.merge(future.result())
+            analytics = accumulator.result()
+            create_summary_sheet(writer, analytics)
+    except Exception:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    
+    if not publish_file(tmp_file, output_file):
+        return
+    
+    analytics_file = analytics_artifact_path(output_file)
+    write_analytics_artifact(analytics, analytics_file)
     
     print(f"\nExcel report generated: {output_file}")
     print(f"  - Summary sheet: 1 (with all analyses)")
     print(f"  - Applicant sheets: {len(applicants)}")
     print(f"  - Questions per applicant: {len(questions)}")
+    print(f"\nAnalytics data written: {analytics_file}")
+
+def temp_output_path(path):
+    """Temporary sibling of an output file (same directory, so the final rename is atomic)"""
+    base, ext = os.path.splitext(path)
+    return f"{base}.tmp-{os.getpid()}-{threading.get_ident()}{ext}"
+
+def publish_file(tmp_path, final_path):
+    """Atomically replace final_path with tmp_path; returns False if the file is locked"""
+    try:
+        os.replace(tmp_path, final_path)
+        return True
+    except PermissionError:
+        # On Windows the old report can't be replaced while it's open in Excel
+        print(f"\nWarning: Could not replace old file (it may be open). Trying to create backup...")
+        backup_file = final_path.replace('.xlsx', '_backup.xlsx')
+        try:
+            os.replace(final_path, backup_file)
+            print(f"Created backup: {backup_file}")
+            os.replace(tmp_path, final_path)
+            return True
+        except OSError:
+            print("Error: Cannot write to file. Please close it if it's open in Excel.")
+            os.remove(tmp_path)
+            return False
+
+# ===== DISK-BACKED MODE =====
+# Records are spilled to SQLite (one column per question ID) in chunks, the
+# Summary analyses run as a single streaming pass over the store, and applicant
+# sheets are written one at a time to a write-only workbook. Peak memory is
+# bounded by the chunk size and the SQLite page cache, not by the export size.
+STORE_CHUNK_SIZE = 500
+STORE_CACHE_KIB = 8 * 1024
+
+def quote_identifier(name):
+    return '"' + name.replace('"', '""') + '"'
+
+def spill_export_to_store(file_path, store_path, chunk_size=STORE_CHUNK_SIZE, schema=SURVEY_SCHEMA):
+    """
+    Parse an export straight into a SQLite store without holding it in memory.
+    Returns (connection, questions), or (None, None) if the export can't be parsed.
+    """
+    rows = iter_export_rows(file_path)
+    header = [next(rows, None) for _ in range(3)]
+    if header[-1] is None:
+        print("Error: TSV file doesn't have enough rows")
+        return None, None
+    
+    question_ids, question_texts = header[0], header[1]
+    plan = compile_extraction_plan(question_ids, question_texts, schema)
+    if plan is None:
+        return None, None
+    questions = plan.questions
+    
+    conn = sqlite3.connect(store_path)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute(f"PRAGMA cache_size = -{STORE_CACHE_KIB}")
+    
+    conn.execute("CREATE TABLE questions (position INTEGER PRIMARY KEY, id TEXT, text TEXT, column_index INTEGER)")
+    conn.executemany("INSERT INTO questions VALUES (?, ?, ?, ?)",
+                     [(i, q['id'], q['text'], q['column_index']) for i, q in enumerate(questions)])
+    
+    columns = ', '.join(f"{quote_identifier(q['id'])} TEXT" for q in questions)
+    conn.execute(f"CREATE TABLE applicants (name TEXT PRIMARY KEY, lab TEXT, {columns})")
+    insert = f"INSERT OR REPLACE INTO applicants VALUES ({', '.join('?' * (len(questions) + 2))})"
+    
+    batch = []
+    for row in rows:
+        record = plan.extract(row)
+        if record is None:
+            continue
+        name, lab, responses = record
+        batch.append((name, lab, *responses))
+        if len(batch) >= chunk_size:
+            conn.executemany(insert, batch)
+            conn.commit()
+            batch.clear()
+    if batch:
+        conn.executemany(insert, batch)
+    conn.commit()
+    
+    return conn, questions
+
+def iter_store_records(conn, questions, order_by='rowid', chunk_size=STORE_CHUNK_SIZE):
+    """Stream (name, lab, [responses]) from the store, chunk_size rows at a time"""
+    columns = ', '.join(quote_identifier(q['id']) for q in questions)
+    cursor = conn.execute(f"SELECT name, lab, {columns} FROM applicants ORDER BY {order_by}")
+    while True:
+        batch = cursor.fetchmany(chunk_size)
+        if not batch:
+            break
+        for row in batch:
+            yield row[0], row[1], row[2:]
+
+def copy_sheet_to_write_only(source, target):
+    """Copy values, styles, column widths and charts of a normal worksheet into a write-only one"""
+    for key, dim in source.column_dimensions.items():
+        target.column_dimensions[key].width = dim.width
+    
+    for row in source.iter_rows():
+        cells = []
+        for cell in row:
+            out = WriteOnlyCell(target, value=cell.value)
+            if cell.style != 'Normal':
+                out.style = cell.style
+            elif cell.has_style:
+                out.font = copy(cell.font)
+                out.fill = copy(cell.fill)
+                out.border = copy(cell.border)
+                out.alignment = copy(cell.alignment)
+                out.number_format = cell.number_format
+            cells.append(out)
+        target.append(cells)
+    
+    # Chart references name the source sheet by title, which the target shares
+    for chart in source._charts:
+        target.add_chart(chart, chart.anchor)
+
+def write_summary_sheet_write_only(workbook, analytics):
+    """Render the (small) Summary sheet normally, then stream it into the write-only workbook"""
+    register_report_styles(workbook)
+    with pd.ExcelWriter(io.BytesIO(), engine='openpyxl') as scratch:
+        create_summary_sheet(scratch, analytics)
+        copy_sheet_to_write_only(scratch.sheets['Summary'], workbook.create_sheet('Summary'))
+
+def write_applicant_sheet_write_only(workbook, applicant_name, responses, question_ids):
+    """Streaming equivalent of one create_applicant_sheets sheet"""
+    worksheet = workbook.create_sheet(excel_sheet_name(applicant_name))
+    
+    header = ['Question ID', 'Question', 'Response']
+    rows = [[question_ids.get(q, ''), q, r] for q, r in responses.items()]
+    
+    # Column widths must be set before any row is written
+    for col_idx, col_letter in enumerate(['A', 'B', 'C']):
+        max_length = max(len(str(value)) for value in [header[col_idx]] + [row[col_idx] for row in rows])
+        worksheet.column_dimensions[col_letter].width = min(max_length + 2, 100)
+    
+    set_response_row_heights(worksheet)
+    
+    header_cells = []
+    for value in header:
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.style = 'Applicant Header'
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+    
+    for row in rows:
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.style = 'Wrapped Body'
+            cells.append(cell)
+        worksheet.append(cells)
+
+def process_tsv_low_memory(input_tsv, output_file, store_path=None, chunk_size=STORE_CHUNK_SIZE):
+    """
+    process_tsv for exports too large to hold in memory (e.g. merged multi-year
+    exports). Pass store_path to keep the SQLite store; otherwise a temporary
+    one is used and removed afterwards.
+    """
+    keep_store = store_path is not None
+    if not keep_store:
+        fd, store_path = tempfile.mkstemp(suffix='.sqlite')
+        os.close(fd)
+        os.remove(store_path)
+    
+    print(f"Parsing Qualtrics export into on-disk store ({store_path})...")
+    conn, questions = spill_export_to_store(input_tsv, store_path, chunk_size)
+    try:
+        if conn is None:
+            return
+        
+        applicant_count = conn.execute("SELECT COUNT(*) FROM applicants").fetchone()[0]
+        if not applicant_count:
+            print("No applicant data found")
+            return
+        
+        print(f"\nProcessing {applicant_count} applicants with {len(questions)} questions each")
+        
+        # Summary analyses: one chunked pass in export order
+        accumulator = SummaryAccumulator(questions)
+        for name, lab, values in iter_store_records(conn, questions, chunk_size=chunk_size):
+            accumulator.add(name, lab, dict(zip((q['id'] for q in questions), values)))
+        analytics = accumulator.result()
+        
+        print("\nCreating Excel report (streaming applicant sheets)...")
+        question_ids = {q['text']: q['id'] for q in questions}
+        workbook = Workbook(write_only=True)
+        write_summary_sheet_write_only(workbook, analytics)
+        for name, _, values in iter_store_records(conn, questions, order_by='name', chunk_size=chunk_size):
+            responses = {}
+            for q, response in zip(questions, values):
+                responses[q['text']] = response
+            write_applicant_sheet_write_only(workbook, name, responses, question_ids)
+        
+        tmp_file = temp_output_path(output_file)
+        try:
+            workbook.save(tmp_file)
+        except Exception:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        
+        if not publish_file(tmp_file, output_file):
+            return
+        
+        analytics_file = analytics_artifact_path(output_file)
+        write_analytics_artifact(analytics, analytics_file)
+        
+        print(f"\nExcel report generated: {output_file}")
+        print(f"  - Summary sheet: 1 (with all analyses)")
+        print(f"  - Applicant sheets: {applicant_count}")
+        print(f"  - Questions per applicant: {len(questions)}")
+        print(f"\nAnalytics data written: {analytics_file}")
+    finally:
+        if conn is not None:
+            conn.close()
+        if not keep_store and os.path.exists(store_path):
+            os.remove(store_path)
+
+# ===== WATCH MODE =====
+def scan_inputs(input_dir, patterns):
+    """Stat cache snapshot: {path: (mtime_ns, size)} for every matching export"""
+    stats = {}
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(input_dir, pattern)):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+    return stats
+
+def regenerate_report(input_path, output_file, low_memory=False, workers=None, parse_cache=PARSE_CACHE_DIR):
+    """Run process_tsv for the watcher; errors are reported without stopping the watch"""
+    try:
+        if low_memory:
+            process_tsv_low_memory(input_path, output_file)
+        else:
+            process_tsv(input_path, output_file, workers=workers, parse_cache=parse_cache)
+    except Exception as e:
+        print(f"Error regenerating report from {input_path}: {e}")
+
+def watch_directory(input_dir, output_file, patterns=('*.tsv', '*.csv', '*.zip'), poll_interval=1.0, debounce=2.0,
+                    low_memory=False, workers=None, parse_cache=PARSE_CACHE_DIR):
+    """
+    Poll input_dir and regenerate the report from the newest export after changes settle:
+    - every poll compares a stat snapshot (mtime, size) against the previous one
+    - any change restarts the debounce timer, so a burst of writes (a download
+      in progress, several files copied at once) triggers one regeneration
+    - regeneration runs on a background thread; changes that arrive meanwhile
+      are picked up by another run once it finishes
+    """
+    print(f"Watching {input_dir} for {', '.join(patterns)} (Ctrl+C to stop)...")
+    known = scan_inputs(input_dir, patterns)
+    pending_since = None
+    worker = None
+    
+    try:
+        while True:
+            time.sleep(poll_interval)
+            current = scan_inputs(input_dir, patterns)
+            if current != known:
+                known = current
+                pending_since = time.monotonic()
+                continue
+            
+            if pending_since is None or time.monotonic() - pending_since < debounce:
+                continue
+            if worker is not None and worker.is_alive():
+                continue
+            
+            pending_since = None
+            if not current:
+                continue
+            newest = max(current, key=lambda path: current[path][0])
+            print(f"\nChange detected, regenerating from {newest}")
+            worker = threading.Thread(target=regenerate_report, args=(newest, output_file, low_memory, workers, parse_cache), daemon=True)
+            worker.start()
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+        if worker is not None:
+            worker.join()
 
 # Run the script
 if __name__ == "__main__":
-    process_tsv(input_tsv, output_file)
+    parser = argparse.ArgumentParser(description="Build the STING applicant report from a Qualtrics export")
+    parser.add_argument('--input', default=input_tsv, help="Qualtrics export to process")
+    parser.add_argument('--output', default=output_file, help="Excel report to write")
+    parser.add_argument('--watch', metavar='DIR', help="Watch DIR and regenerate whenever a new export lands")
+    parser.add_argument('--pattern', action='append', help="Export filename pattern to watch (default: *.tsv, *.csv, *.zip)")
+    parser.add_argument('--poll-interval', type=float, default=1.0, help="Seconds between directory scans")
+    parser.add_argument('--debounce', type=float, default=2.0, help="Seconds without changes before regenerating")
+    parser.add_argument('--low-memory', action='store_true', help="Spill records to an on-disk store and stream the report")
+    parser.add_argument('--store', help="SQLite store to keep (with --low-memory); a temporary one is used otherwise")
+    parser.add_argument('--chunk-size', type=int, default=STORE_CHUNK_SIZE, help="Rows per chunk in --low-memory mode")
+    parser.add_argument('--schema', help="JSON file of SURVEY_SCHEMA overrides for a different survey version")
+    parser.add_argument('--workers', type=int, help="Processes for the text analytics (default: one per spare CPU; 0 runs them inline)")
+    parser.add_argument('--parse-cache', default=PARSE_CACHE_DIR, metavar='DIR', help="Directory of cached parsed exports")
+    parser.add_argument('--no-parse-cache', action='store_true', help="Always parse the export, without reading or writing the cache")
+    args = parser.parse_args()
+    
+    if args.schema:
+        SURVEY_SCHEMA.update(load_survey_schema(args.schema))
+    
+    parse_cache = None if args.no_parse_cache else args.parse_cache
+    
+    if args.watch:
+        watch_directory(args.watch, args.output, patterns=args.pattern or ['*.tsv', '*.csv', '*.zip'],
+                        poll_interval=args.poll_interval, debounce=args.debounce, low_memory=args.low_memory,
+                        workers=args.workers, parse_cache=parse_cache)
+    elif args.low_memory:
+        process_tsv_low_memory(args.input, args.output, store_path=args.store, chunk_size=args.chunk_size)
+    else:
+        process_tsv(args.input, args.output, workers=args.workers, parse_cache=parse_cache)
@@ -0,0 +1,176 @@
+"""
+Inter-rater agreement and outlier-judge analytics over the latest-vote matrix
+(see vote_ranking.build_vote_matrix).
+
+- Fleiss' kappa on status (Approve/Reject/Maybe), generalized to applicants
+  rated by different numbers of judges
+- Krippendorff's alpha on rating (interval metric), which handles missing votes
+- per-judge deviation from the consensus of the other judges (leave-one-out)
+- contested applicants: high rating spread or a real Approve/Reject split
+
+Everything is computed with closed-form sums over NumPy arrays; there are
+no per-applicant or per-judge Python loops.
+"""
+
+import numpy as np
+import pandas as pd
+
+from vote_ranking import build_vote_matrix
+
+STATUS_CATEGORIES = ['Approve', 'Reject', 'Maybe']
+
+# Contested thresholds
+CONTESTED_RATING_SD = 1.0      # rating standard deviation across judges
+CONTESTED_SPLIT_SHARE = 1 / 3  # minority share of Approve+Reject votes
+
+# A judge is flagged when their mean deviation is this many SDs above the panel's
+OUTLIER_Z = 1.5
+
+
+def status_counts(df_latest, matrix):
+    """Applicants x categories counts of status votes"""
+    applicant_idx = pd.Categorical(df_latest['applicant_name'].astype(str), categories=matrix.applicants).codes
+    category_idx = pd.Categorical(df_latest['status'].astype(str), categories=STATUS_CATEGORIES).codes
+    keep = (applicant_idx >= 0) & (category_idx >= 0)
+
+    counts = np.zeros((len(matrix.applicants), len(STATUS_CATEGORIES)))
+    np.add.at(counts, (applicant_idx[keep], category_idx[keep]), 1)
+    return counts
+
+
+def fleiss_kappa(counts):
+    """
+    Fleiss' kappa from an items x categories count matrix. Items with fewer
+    than two ratings are ignored; rater counts may differ between items.
+    """
+    raters = counts.sum(axis=1)
+    counts = counts[raters >= 2]
+    raters = raters[raters >= 2]
+    if len(counts) == 0:
+        return np.nan
+
+    item_agreement = ((counts ** 2).sum(axis=1) - raters) / (raters * (raters - 1))
+    observed = item_agreement.mean()
+    proportions = counts.sum(axis=0) / raters.sum()
+    expected = (proportions ** 2).sum()
+    if expected >= 1:
+        return np.nan
+    return (observed - expected) / (1 - expected)
+
+
+def krippendorff_alpha_interval(ratings, mask):
+    """
+    Krippendorff's alpha (interval metric) from a raters x units matrix.
+    Uses sum over pairs (v_i - v_j)^2 = 2 (m * sum v^2 - (sum v)^2).
+    """
+    per_unit = mask.sum(axis=0)
+    pairable = per_unit >= 2
+    if pairable.sum() == 0:
+        return np.nan
+
+    values = np.where(mask, ratings, 0.0)[:, pairable]
+    m = per_unit[pairable]
+    unit_sum = values.sum(axis=0)
+    unit_sq = (values ** 2).sum(axis=0)
+
+    n = m.sum()
+    observed = (2 * (m * unit_sq - unit_sum ** 2) / (m - 1)).sum() / n
+    expected = 2 * (n * unit_sq.sum() - unit_sum.sum() ** 2) / (n * (n - 1))
+    if expected == 0:
+        return np.nan
+    return 1 - observed / expected
+
+
+def judge_deviation(matrix):
+    """
+    How far each judge sits from the other judges on the same applicants:
+    - Mean Δ Rating: signed (negative = harsher than the rest of the panel)
+    - Mean |Δ Rating|: size of the deviation
+    - Status Disagreement: share of votes more than half a status step from the others' average
+    """
+    ratings, mask = matrix.ratings, matrix.mask
+    filled = np.where(mask, ratings, 0.0)
+
+    # Leave-one-out consensus of the other judges for every vote
+    total = filled.sum(axis=0)
+    count = mask.sum(axis=0)
+    others = count[None, :] - mask
+    with np.errstate(invalid='ignore', divide='ignore'):
+        loo_mean = (total[None, :] - filled) / others
+    comparable = mask & (others > 0)
+    delta = np.where(comparable, ratings - loo_mean, 0.0)
+    n_comparable = comparable.sum(axis=1)
+
+    # Average status score of the other judges (Approve=1 / Maybe=0.5 / Reject=0)
+    status = np.where(mask, matrix.status_scores, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        loo_status = (status.sum(axis=0)[None, :] - status) / others
+    disagrees = comparable & (np.abs(matrix.status_scores - loo_status) > 0.5)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_delta = np.where(n_comparable > 0, delta.sum(axis=1) / n_comparable, np.nan)
+        mean_abs = np.where(n_comparable > 0, np.abs(delta).sum(axis=1) / n_comparable, np.nan)
+        disagreement = np.where(n_comparable > 0, disagrees.sum(axis=1) / n_comparable, np.nan)
+
+    df = pd.DataFrame({
+        'Judge': matrix.judges,
+        'Votes': mask.sum(axis=1),
+        'Compared': n_comparable,
+        'Mean Δ Rating': mean_delta,
+        'Mean |Δ Rating|': mean_abs,
+        'Status Disagreement': disagreement,
+    })
+
+    # Flag judges well above the panel's typical deviation (needs at least 3 judges to mean anything)
+    valid = df['Mean |Δ Rating|'].dropna()
+    df['Outlier'] = False
+    if len(valid) >= 3 and valid.std(ddof=0) > 0:
+        z = (df['Mean |Δ Rating|'] - valid.mean()) / valid.std(ddof=0)
+        df['Outlier'] = (z > OUTLIER_Z).fillna(False)
+
+    return df.sort_values('Mean |Δ Rating|', ascending=False, na_position='last').reset_index(drop=True)
+
+
+def contested_applicants(matrix, counts):
+    """Applicants with a wide rating spread or a real Approve/Reject split"""
+    mask = matrix.mask
+    n = mask.sum(axis=0)
+    filled = np.where(mask, matrix.ratings, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = filled.sum(axis=0) / n
+        sd = np.sqrt(np.where(mask, (matrix.ratings - mean) ** 2, 0.0).sum(axis=0) / n)
+
+    approve, reject, maybe = counts[:, 0], counts[:, 1], counts[:, 2]
+    decided = approve + reject
+    with np.errstate(invalid='ignore', divide='ignore'):
+        minority_share = np.minimum(approve, reject) / decided
+
+    high_spread = (n >= 2) & (sd >= CONTESTED_RATING_SD)
+    split = (decided >= 2) & (minority_share >= CONTESTED_SPLIT_SHARE)
+    contested = high_spread | split
+
+    reasons = np.where(high_spread & split, "Rating spread + status split",
+                       np.where(split, "Status split", "Rating spread"))
+
+    df = pd.DataFrame({
+        'Applicant': np.array(matrix.applicants, dtype=object),
+        'Votes': n,
+        'Rating SD': sd,
+        'Approve': approve.astype(int),
+        'Reject': reject.astype(int),
+        'Maybe': maybe.astype(int),
+        'Reason': reasons,
+    })[contested]
+    return df.sort_values(['Rating SD', 'Votes'], ascending=[False, False]).reset_index(drop=True)
+
+
+def agreement_report(df_latest, applicant_names):
+    """All agreement analytics for the latest votes, as one dict"""
+    matrix = build_vote_matrix(df_latest, applicant_names)
+    counts = status_counts(df_latest, matrix)
+    return {
+        'fleiss_kappa': fleiss_kappa(counts),
+        'krippendorff_alpha': krippendorff_alpha_interval(matrix.ratings, matrix.mask),
+        'judges': judge_deviation(matrix),
+        'contested': contested_applicants(matrix, counts),
+    }
@@ -0,0 +1,167 @@
+"""
+Firestore reads for the voting dashboard.
+
+VoteWatcher keeps a snapshot listener open and applies its changes to an
+in-memory copy of the round's votes, so every session reads the votes from
+that copy: Firestore bills each changed document once per process instead
+of a full collection read per session.
+
+votes_page builds what one Vote tab render shows (each applicant's vote
+history and the judge's latest vote) from that copy, so rendering a page
+costs no reads however many applicants it lists.
+
+The reads that still go to Firestore (the round list, the judge's latest
+vote around a save, and the round's votes for a session without a listener)
+run on one event loop with the Firestore AsyncClient. Reads that don't
+depend on each other are issued together and gathered, so they cost one
+round trip instead of the sum. Streamlit scripts are synchronous, so
+VoteFetcher runs the event loop on a background thread and exposes
+blocking methods.
+
+Every read takes the votes collection path of the active round (see
+vote_rounds.py).
+"""
+
+import asyncio
+import threading
+
+from firebase_admin import firestore
+
+from vote_rounds import ROUNDS_COLLECTION
+from vote_schema import votes_to_df, latest_votes
+
+# Upper bound on in-flight queries per gather
+MAX_CONCURRENT_QUERIES = 32
+
+
+async def _stream_dicts(query, semaphore):
+    """Run a query and return its documents as dicts"""
+    async with semaphore:
+        return [doc.to_dict() async for doc in query.stream()]
+
+
+async def _stream_docs(query):
+    """Run a query and return its document snapshots (with their IDs)"""
+    return [doc async for doc in query.stream()]
+
+
+def _judge_vote_query(db, collection, judge_name, applicant_name):
+    return (db.collection(collection)
+            .where('judge_name', '==', judge_name)
+            .where('applicant_name', '==', applicant_name)
+            .order_by('vote_version', direction=firestore.Query.DESCENDING)
+            .limit(1))
+
+
+async def fetch_after_vote(db, collection, judge_name, applicant_name, include_votes=False):
+    """
+    Reads a save needs once its vote is written, in a single gather:
+    - judge_vote: the judge's latest vote on the applicant (to confirm the write), or None
+    - votes: every vote document of the round (a session's own copy); None with include_votes=False
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    latest = _stream_dicts(_judge_vote_query(db, collection, judge_name, applicant_name), semaphore)
+    all_votes = (_stream_dicts(db.collection(collection), semaphore)
+                 if include_votes else asyncio.sleep(0, result=None))
+
+    latest, votes = await asyncio.gather(latest, all_votes)
+    return {'judge_vote': latest[0] if latest else None, 'votes': votes}
+
+
+def votes_page(df_votes, judge_name, applicant_names):
+    """
+    Everything one Vote tab render needs, from a votes frame already in memory:
+    - applicant_votes: {applicant: votes frame} history per applicant, oldest version first
+    - judge_votes: {applicant: vote dict or None} judge's latest vote per applicant
+    """
+    wanted = df_votes[df_votes['applicant_name'].isin(applicant_names)]
+    histories = {name: group.sort_values('vote_version')
+                 for name, group in wanted.groupby('applicant_name', observed=True)}
+    mine = latest_votes(wanted[wanted['judge_name'] == judge_name])
+    judge_votes = {row['applicant_name']: row for row in mine.to_dict('records')}
+
+    empty = df_votes.iloc[:0]
+    return {
+        'applicant_votes': {name: histories.get(name, empty) for name in applicant_names},
+        'judge_votes': {name: judge_votes.get(name) for name in applicant_names},
+    }
+
+
+class VoteFetcher:
+    """Blocking facade over the async Firestore client, safe to call from Streamlit"""
+
+    def __init__(self, db):
+        self.db = db
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def run(self, coro):
+        """Run a coroutine on the fetcher's event loop and wait for the result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def judge_vote(self, collection, judge_name, applicant_name):
+        """The judge's latest vote on the applicant as a dict, or None"""
+        docs = self.run(_stream_dicts(_judge_vote_query(self.db, collection, judge_name, applicant_name),
+                                      asyncio.Semaphore(1)))
+        return docs[0] if docs else None
+
+    def votes(self, collection):
+        """Every vote document of one round as dicts"""
+        return self.run(_stream_dicts(self.db.collection(collection), asyncio.Semaphore(1)))
+
+    def after_vote(self, collection, judge_name, applicant_name, include_votes=False):
+        return self.run(fetch_after_vote(self.db, collection, judge_name, applicant_name, include_votes))
+
+    def rounds(self):
+        """Round documents, oldest first (see vote_rounds.rounds_from_docs)"""
+        return self.run(_stream_docs(self.db.collection(ROUNDS_COLLECTION).order_by('created_at')))
+
+
+class VoteWatcher:
+    """
+    Snapshot listener on one votes collection that keeps its documents.
+    `revision` goes up whenever a vote is added or changed (by any judge);
+    current_votes() serves the typed frame for the latest revision, built
+    once and shared by every session (don't modify it).
+    """
+
+    def __init__(self, db, collection='votes'):
+        self.revision = 0
+        self._primed = False
+        self._docs = {}
+        self._frame = None
+        self._frame_revision = None
+        self._changed = threading.Condition()
+        self._watch = db.collection(collection).on_snapshot(self._on_snapshot)
+
+    def _on_snapshot(self, docs, changes, read_time):
+        with self._changed:
+            for change in changes:
+                if change.type.name == 'REMOVED':
+                    self._docs.pop(change.document.id, None)
+                else:
+                    self._docs[change.document.id] = change.document.to_dict()
+            # The first snapshot is the existing collection, not a change
+            if self._primed and changes:
+                self.revision += 1
+            self._primed = True
+            self._changed.notify_all()
+
+    def current_votes(self, wait_for=None, timeout=5.0):
+        """
+        Typed votes frame as of the latest snapshot, or None if the first
+        snapshot hasn't arrived within `timeout`. With wait_for (a document
+        ID this session just wrote), wait up to `timeout` for it to arrive.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._primed and (wait_for is None or wait_for in self._docs), timeout)
+            if not self._primed:
+                return None
+            if self._frame_revision != self.revision:
+                self._frame = votes_to_df(list(self._docs.values()))
+                self._frame_revision = self.revision
+            return self._frame
+
+    def close(self):
+        self._watch.unsubscribe()
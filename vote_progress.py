@@ -0,0 +1,63 @@
+"""
+Judging progress from a set index of (judge, applicant) pairs that have a vote.
+
+Built once per render from the votes already in memory (no extra reads);
+every per-judge question (completion, remaining applicants, next unvoted)
+is a set lookup, and the admin summary covers all judges in one pass.
+"""
+
+from collections import defaultdict
+
+import pandas as pd
+
+
+class ProgressIndex:
+    """Which judges have voted on which applicants"""
+
+    def __init__(self, df_votes, applicant_names):
+        self.applicants = list(applicant_names)
+        known = set(self.applicants)
+
+        self.pairs = set(zip(df_votes['judge_name'].astype(str), df_votes['applicant_name'].astype(str)))
+        self.voted = defaultdict(set)
+        for judge, applicant in self.pairs:
+            if applicant in known:  # votes for applicants no longer in the report don't count
+                self.voted[judge].add(applicant)
+
+    def has_voted(self, judge, applicant):
+        return (judge, applicant) in self.pairs
+
+    def completion(self, judge):
+        """(voted, total, fraction) for one judge"""
+        voted = len(self.voted.get(judge, ()))
+        total = len(self.applicants)
+        return voted, total, (voted / total if total else 0.0)
+
+    def remaining(self, judge, order=None):
+        """Applicants the judge hasn't voted on, in `order` (default: report order)"""
+        voted = self.voted.get(judge, set())
+        return [name for name in (self.applicants if order is None else order) if name not in voted]
+
+    def next_unvoted(self, judge, order=None, skip=()):
+        """First remaining applicant not in `skip`, or None when there's nothing left"""
+        voted = self.voted.get(judge, set())
+        for name in (self.applicants if order is None else order):
+            if name not in voted and name not in skip:
+                return name
+        return None
+
+    def summary(self):
+        """Progress of every judge who has voted, least complete first"""
+        total = len(self.applicants)
+        rows = []
+        for judge, voted in self.voted.items():
+            next_name = next((name for name in self.applicants if name not in voted), None)
+            rows.append({
+                'Judge': judge,
+                'Voted': len(voted),
+                'Remaining': total - len(voted),
+                'Completion': len(voted) / total if total else 0.0,
+                'Next Unvoted': next_name or "✅ Done",
+            })
+        columns = ['Judge', 'Voted', 'Remaining', 'Completion', 'Next Unvoted']
+        return pd.DataFrame(rows, columns=columns).sort_values(['Completion', 'Judge']).reset_index(drop=True)
@@ -0,0 +1,159 @@
+"""
+Consensus ranking engine for judge votes.
+
+Latest votes are laid out as a dense judges x applicants matrix (NaN and a
+boolean mask where a judge hasn't voted), and every score is computed with
+vectorized NumPy over that matrix:
+- z-score: each judge's ratings standardized against that judge's own mean
+  and spread, so harsh and lenient judges count equally
+- Borda: each judge's ratings turned into rank points (ties share points),
+  normalized to 0-1 so judges who rated different numbers of applicants
+  are comparable
+- status score: mean of Approve=1 / Maybe=0.5 / Reject=0
+- bootstrap CI: percentile interval of the mean z-score over judges
+  resampled with replacement
+"""
+
+import numpy as np
+import pandas as pd
+
+STATUS_WEIGHTS = {'Approve': 1.0, 'Maybe': 0.5, 'Reject': 0.0}
+RATING_LEVELS = np.arange(1, 6)
+
+BOOTSTRAP_SAMPLES = 1000
+CONFIDENCE = 0.95
+
+
+class VoteMatrix:
+    """Judges x applicants layout of the latest votes"""
+
+    def __init__(self, judges, applicants, ratings, status_scores, mask):
+        self.judges = judges
+        self.applicants = applicants
+        self.ratings = ratings
+        self.status_scores = status_scores
+        self.mask = mask
+
+
+def build_vote_matrix(df_latest, applicant_names):
+    """Lay out latest votes (one row per judge/applicant) as dense matrices"""
+    judges = sorted(df_latest['judge_name'].astype(str).unique())
+    applicants = list(applicant_names)
+
+    judge_idx = pd.Categorical(df_latest['judge_name'].astype(str), categories=judges).codes
+    applicant_idx = pd.Categorical(df_latest['applicant_name'].astype(str), categories=applicants).codes
+    known = applicant_idx >= 0  # votes for applicants no longer in the report are ignored
+
+    shape = (len(judges), len(applicants))
+    ratings = np.full(shape, np.nan)
+    status_scores = np.full(shape, np.nan)
+    mask = np.zeros(shape, dtype=bool)
+
+    rows, cols = judge_idx[known], applicant_idx[known]
+    ratings[rows, cols] = df_latest['rating'].to_numpy(dtype=float)[known]
+    status_scores[rows, cols] = df_latest['status'].astype(str).map(STATUS_WEIGHTS).to_numpy(dtype=float)[known]
+    mask[rows, cols] = True
+
+    return VoteMatrix(judges, applicants, ratings, status_scores, mask)
+
+
+def _masked_mean(values, mask, axis):
+    counts = mask.sum(axis=axis)
+    sums = np.where(mask, values, 0.0).sum(axis=axis)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def zscore_ratings(ratings, mask):
+    """Standardize each judge's ratings; judges with no spread get 0 for every vote"""
+    means = _masked_mean(ratings, mask, axis=1)[:, None]
+    deviations = np.where(mask, ratings - means, 0.0)
+    counts = mask.sum(axis=1)[:, None]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stds = np.sqrt((deviations ** 2).sum(axis=1, keepdims=True) / counts)
+        z = np.where(stds > 0, deviations / stds, 0.0)
+    return np.where(mask, z, np.nan)
+
+
+def borda_points(ratings, mask):
+    """
+    Normalized Borda points per vote: the share of the judge's other rated
+    applicants this one beats, counting ties as half.
+    """
+    filled = np.where(mask, ratings, 0).astype(int)
+    onehot = (filled[:, :, None] == RATING_LEVELS[None, None, :]) & mask[:, :, None]
+    level_counts = onehot.sum(axis=1)                                    # judges x levels
+    below = np.cumsum(level_counts, axis=1) - level_counts               # rated strictly lower
+
+    level_idx = np.clip(filled - RATING_LEVELS[0], 0, len(RATING_LEVELS) - 1)
+    rows = np.arange(ratings.shape[0])[:, None]
+    points = below[rows, level_idx] + 0.5 * (level_counts[rows, level_idx] - 1)
+
+    others = mask.sum(axis=1, keepdims=True) - 1
+    with np.errstate(invalid='ignore', divide='ignore'):
+        normalized = np.where(others > 0, points / others, 0.5)
+    return np.where(mask, normalized, np.nan)
+
+
+def bootstrap_ci(scores, mask, samples=BOOTSTRAP_SAMPLES, confidence=CONFIDENCE, seed=0):
+    """
+    Percentile CI of each applicant's mean score with judges resampled with
+    replacement. Each resample is a vector of judge multiplicities, so all
+    resamples are evaluated with two matrix products.
+    """
+    n_judges = scores.shape[0]
+    if n_judges < 2:
+        nan = np.full(scores.shape[1], np.nan)
+        return nan, nan
+
+    rng = np.random.default_rng(seed)
+    weights = rng.multinomial(n_judges, np.full(n_judges, 1.0 / n_judges), size=samples)  # samples x judges
+    sums = weights @ np.where(mask, scores, 0.0)
+    counts = weights @ mask.astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(counts > 0, sums / counts, np.nan)
+
+    alpha = (1 - confidence) / 2
+    # Applicants with no votes have no interval
+    with np.errstate(invalid='ignore'):
+        low = np.full(scores.shape[1], np.nan)
+        high = np.full(scores.shape[1], np.nan)
+        voted = mask.any(axis=0)
+        if voted.any():
+            low[voted] = np.nanquantile(means[:, voted], alpha, axis=0)
+            high[voted] = np.nanquantile(means[:, voted], 1 - alpha, axis=0)
+    return low, high
+
+
+def rank_applicants(df_latest, applicant_names, samples=BOOTSTRAP_SAMPLES, seed=0):
+    """
+    Leaderboard of applicants by consensus score (mean judge-normalized
+    z-score), with Borda, status and raw-rating columns for comparison.
+    Applicants without votes are listed last.
+    """
+    matrix = build_vote_matrix(df_latest, applicant_names)
+    mask = matrix.mask
+
+    z = zscore_ratings(matrix.ratings, mask)
+    consensus = _masked_mean(z, mask, axis=0)
+    ci_low, ci_high = bootstrap_ci(z, mask, samples=samples, seed=seed)
+
+    leaderboard = pd.DataFrame({
+        'Applicant': matrix.applicants,
+        'Votes': mask.sum(axis=0),
+        'Consensus (z)': consensus,
+        'CI Low': ci_low,
+        'CI High': ci_high,
+        'Borda': _masked_mean(borda_points(matrix.ratings, mask), mask, axis=0),
+        'Status Score': _masked_mean(matrix.status_scores, mask, axis=0),
+        'Mean Rating': _masked_mean(matrix.ratings, mask, axis=0),
+    })
+
+    leaderboard = leaderboard.sort_values(
+        ['Consensus (z)', 'Status Score', 'Applicant'],
+        ascending=[False, False, True],
+        na_position='last'
+    ).reset_index(drop=True)
+    leaderboard.insert(0, 'Rank', np.where(leaderboard['Votes'] > 0, np.arange(1, len(leaderboard) + 1), 0))
+    leaderboard['Rank'] = leaderboard['Rank'].replace(0, pd.NA).astype('Int64')
+    return leaderboard
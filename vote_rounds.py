@@ -0,0 +1,122 @@
+"""
+Voting rounds and cohorts.
+
+Each round keeps its votes in its own collection, rounds/<round_id>/votes,
+so every query the dashboard makes is scoped to the active round and costs
+the same however many rounds came before. The original flat `votes`
+collection is the default round.
+
+A round document in the `rounds` collection holds:
+- label: name shown in the round selector
+- applicants_file: the applicant report (parse_tsv.py output) for the cohort
+- applicants: names carried over from the parent round, or None for everyone in the report
+- parent: round the shortlist came from (None for a new cohort)
+
+Carry a shortlist over with "Start Next Round" in the Export tab. Start a
+new cohort from its own report with:
+    python vote_rounds.py --credentials service_account.json --label "STING 2027" --applicants-file fOutputAndaReport_2027.xlsx
+"""
+
+import argparse
+import re
+
+from firebase_admin import firestore
+from google.api_core.exceptions import AlreadyExists
+
+ROUNDS_COLLECTION = "rounds"
+DEFAULT_ROUND_ID = "default"
+DEFAULT_ROUND_LABEL = "Round 1"
+
+# Default shortlist for the next round: applicants with more than this share of Approve votes (a majority)
+SHORTLIST_APPROVE_SHARE = 0.5
+
+
+def votes_collection_path(round_id):
+    """Collection path holding one round's votes"""
+    if round_id == DEFAULT_ROUND_ID:
+        return "votes"
+    return f"{ROUNDS_COLLECTION}/{round_id}/votes"
+
+
+def default_round(applicants_file):
+    return {
+        'id': DEFAULT_ROUND_ID,
+        'label': DEFAULT_ROUND_LABEL,
+        'applicants_file': applicants_file,
+        'applicants': None,
+        'parent': None,
+    }
+
+
+def load_rounds(db, default_applicants_file):
+    """All rounds, oldest first, starting with the default round"""
+    return rounds_from_docs(db.collection(ROUNDS_COLLECTION).order_by('created_at').stream(), default_applicants_file)
+
+
+def rounds_from_docs(docs, default_applicants_file):
+    """Round dicts from round documents (oldest first), starting with the default round"""
+    rounds = [default_round(default_applicants_file)]
+    for doc in docs:
+        data = doc.to_dict()
+        rounds.append({
+            'id': doc.id,
+            'label': data.get('label') or doc.id,
+            'applicants_file': data.get('applicants_file') or default_applicants_file,
+            'applicants': data.get('applicants'),
+            'parent': data.get('parent'),
+        })
+    return rounds
+
+
+def round_id_for(label, existing_ids):
+    """URL-safe document ID for a new round, unique among existing_ids"""
+    base = re.sub(r'[^a-z0-9]+', '-', label.lower()).strip('-') or "round"
+    round_id, n = base, 2
+    while round_id in existing_ids:
+        round_id, n = f"{base}-{n}", n + 1
+    return round_id
+
+
+def create_round(db, label, applicants_file, applicants=None, parent=None, existing_ids=()):
+    """
+    Register a round under a new ID derived from label and return the ID; its
+    votes collection is created by the first vote. existing_ids may be out of
+    date: an ID someone else has taken meanwhile is skipped, never overwritten.
+    """
+    taken = set(existing_ids) | {DEFAULT_ROUND_ID}
+    while True:
+        round_id = round_id_for(label, taken)
+        try:
+            db.collection(ROUNDS_COLLECTION).document(round_id).create({
+                'label': label,
+                'applicants_file': applicants_file,
+                'applicants': sorted(applicants) if applicants is not None else None,
+                'parent': parent,
+                'created_at': firestore.SERVER_TIMESTAMP,
+            })
+            return round_id
+        except AlreadyExists:
+            taken.add(round_id)
+
+
+def default_shortlist(df_latest, applicant_names):
+    """Applicants whose latest votes are more than SHORTLIST_APPROVE_SHARE Approve"""
+    approve_share = (df_latest['status'] == 'Approve').groupby(df_latest['applicant_name'], observed=True).mean()
+    return [name for name in applicant_names if approve_share.get(name, 0) > SHORTLIST_APPROVE_SHARE]
+
+
+if __name__ == "__main__":
+    import firebase_admin
+    from firebase_admin import credentials
+
+    parser = argparse.ArgumentParser(description="Start a new voting round for a cohort")
+    parser.add_argument("--credentials", required=True, help="Service account JSON file")
+    parser.add_argument("--database", default="dbsv", help="Firestore database ID")
+    parser.add_argument("--label", required=True, help="Round name shown in the dashboard")
+    parser.add_argument("--applicants-file", required=True, help="Applicant report for the cohort")
+    args = parser.parse_args()
+
+    firebase_admin.initialize_app(credentials.Certificate(args.credentials))
+    db = firestore.client(database_id=args.database)
+    round_id = create_round(db, args.label, args.applicants_file)
+    print(f"✅ Created round '{args.label}' ({round_id}); votes go to {votes_collection_path(round_id)}")
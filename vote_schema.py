@@ -0,0 +1,145 @@
+"""
+Vote document schema and the typed in-memory vote frame.
+
+New votes store `timestamp` as a Firestore server timestamp. Older votes
+carry a local-time '%Y-%m-%d %H:%M:%S' string; those are converted on load
+(and can be rewritten in place with migrate_legacy_timestamps) from
+LEGACY_TIMEZONE, which the VOTE_LEGACY_TIMEZONE environment variable (or a
+top-level key of that name in secrets.toml) overrides. "Latest" is decided
+by vote_version, as save_vote numbers revisions, so a timestamp converted
+from the wrong zone can't bring back a superseded vote.
+
+Rewrite a collection's legacy timestamps in place with:
+    python vote_schema.py --credentials service_account.json --collection votes
+"""
+
+import argparse
+import os
+from datetime import datetime
+
+import pandas as pd
+
+# Vote document fields, in display order
+VOTE_COLUMNS = [
+    'timestamp', 'judge_name', 'applicant_name', 'status',
+    'rating', 'comment', 'original_status', 'original_rating', 'vote_version'
+]
+
+VOTE_STATUSES = ["Approve", "Reject", "Maybe"]
+
+# Legacy string timestamps were written in the dashboard host's local time
+LEGACY_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+LEGACY_TIMEZONE = os.environ.get('VOTE_LEGACY_TIMEZONE') or 'America/New_York'
+
+# Time zone used when showing or exporting timestamps
+DISPLAY_TIMEZONE = 'America/New_York'
+
+STATUS_DTYPE = pd.CategoricalDtype(VOTE_STATUSES)
+ORIGINAL_STATUS_DTYPE = pd.CategoricalDtype([""] + VOTE_STATUSES)
+
+
+def parse_legacy_timestamp(value, tz=LEGACY_TIMEZONE):
+    """Convert a legacy local-time timestamp string to an aware UTC Timestamp"""
+    local = pd.Timestamp(datetime.strptime(value, LEGACY_TIMESTAMP_FORMAT))
+    return local.tz_localize(tz, ambiguous=True, nonexistent='shift_forward').tz_convert('UTC')
+
+
+def to_utc_timestamps(values, tz=LEGACY_TIMEZONE):
+    """Normalize a column of mixed legacy strings and native timestamps to UTC"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.tz_localize('UTC') if values.dt.tz is None else values.dt.tz_convert('UTC')
+
+    converted = []
+    for value in values.tolist():
+        if value is None or (not isinstance(value, (str, datetime)) and pd.isna(value)):
+            converted.append(pd.NaT)
+        elif isinstance(value, str):
+            converted.append(parse_legacy_timestamp(value, tz))
+        else:
+            ts = pd.Timestamp(value)
+            converted.append(ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC'))
+    return pd.to_datetime(pd.Series(converted, index=values.index, dtype=object), utc=True)
+
+
+def votes_to_df(votes_data):
+    """
+    Build a typed votes DataFrame from a list of vote dicts (or an existing
+    votes DataFrame, e.g. a loaded snapshot):
+    - timestamp: datetime64 in UTC (legacy strings converted)
+    - judge_name / applicant_name / status / original_status: categorical
+    - rating / original_rating: int8, vote_version: int16
+    """
+    if isinstance(votes_data, pd.DataFrame):
+        votes_data = votes_data.copy()
+    else:
+        votes_data = list(votes_data)
+    if len(votes_data):
+        df = pd.DataFrame(votes_data)
+        for col in VOTE_COLUMNS:
+            if col not in df.columns:
+                df[col] = None
+    else:
+        df = pd.DataFrame(columns=VOTE_COLUMNS)
+
+    df['timestamp'] = to_utc_timestamps(df['timestamp'])
+    df['judge_name'] = df['judge_name'].astype('category')
+    df['applicant_name'] = df['applicant_name'].astype('category')
+    df['status'] = df['status'].astype(STATUS_DTYPE)
+    df['original_status'] = df['original_status'].fillna("").astype(ORIGINAL_STATUS_DTYPE)
+    df['rating'] = pd.to_numeric(df['rating']).fillna(0).astype('int8')
+    df['original_rating'] = pd.to_numeric(df['original_rating']).fillna(0).astype('int8')
+    df['vote_version'] = pd.to_numeric(df['vote_version']).fillna(1).astype('int16')
+    return df
+
+
+def latest_votes(df_votes):
+    """
+    Keep each judge's latest vote per applicant: the highest vote_version,
+    with the timestamp only breaking ties (a missing one counts as oldest)
+    """
+    return (df_votes.sort_values(['vote_version', 'timestamp'], na_position='first', kind='stable')
+            .groupby(['judge_name', 'applicant_name'], observed=True)
+            .tail(1))
+
+
+def vote_fingerprint(df_votes):
+    """Order-independent hash of the votes; changes whenever a vote is added or revised"""
+    if df_votes.empty:
+        return 0
+    columns = ['judge_name', 'applicant_name', 'vote_version', 'status', 'rating']
+    hashes = pd.util.hash_pandas_object(df_votes[columns].astype(str), index=False)
+    return int(hashes.sum())
+
+
+def localize_timestamps(df, tz=DISPLAY_TIMEZONE):
+    """Return a copy with naive local timestamps (Excel can't store time zones)"""
+    df = df.copy()
+    df['timestamp'] = df['timestamp'].dt.tz_convert(tz).dt.tz_localize(None)
+    return df
+
+
+def migrate_legacy_timestamps(db, collection='votes', tz=LEGACY_TIMEZONE):
+    """Rewrite string timestamps in Firestore as native timestamps; returns count"""
+    migrated = 0
+    for doc in db.collection(collection).stream():
+        value = doc.to_dict().get('timestamp')
+        if isinstance(value, str):
+            doc.reference.update({'timestamp': parse_legacy_timestamp(value, tz).to_pydatetime()})
+            migrated += 1
+    return migrated
+
+
+if __name__ == "__main__":
+    import firebase_admin
+    from firebase_admin import credentials, firestore
+
+    parser = argparse.ArgumentParser(description="Convert legacy string vote timestamps to Firestore timestamps")
+    parser.add_argument("--credentials", required=True, help="Service account JSON file")
+    parser.add_argument("--database", default="dbsv", help="Firestore database ID")
+    parser.add_argument("--collection", default="votes", help="Votes collection (rounds/<round_id>/votes for a later round)")
+    parser.add_argument("--timezone", default=LEGACY_TIMEZONE, help="Time zone the legacy timestamps were written in")
+    args = parser.parse_args()
+
+    firebase_admin.initialize_app(credentials.Certificate(args.credentials))
+    count = migrate_legacy_timestamps(firestore.client(database_id=args.database), args.collection, args.timezone)
+    print(f"✅ Converted {count} legacy timestamps in {args.collection}")
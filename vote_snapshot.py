@@ -0,0 +1,132 @@
+"""
+Offline vote snapshots.
+
+A snapshot is every vote document frozen to a local file, so the dashboard
+can run Results and Export (read-only) after voting has closed or for demos
+without any Firestore reads:
+- .jsonl: one header line {"snapshot_at", "format", "votes", "round"} then one vote per line
+- .parquet: columnar; needs pyarrow (not in requirements.txt)
+
+A snapshot holds the votes of one round and records that round (ID, label,
+applicants file, shortlist), so a read-only dashboard shows the same cohort.
+
+Write one from Firestore:
+    python vote_snapshot.py --credentials service_account.json --output votes_snapshot.jsonl
+    python vote_snapshot.py --credentials service_account.json --round sting-2027 --output votes_snapshot_sting-2027.jsonl
+or with the "Save Vote Snapshot" button in the Export tab. Run the dashboard
+from it by setting `vote_snapshot = "votes_snapshot.jsonl"` in secrets.toml
+(or the VOTE_SNAPSHOT environment variable).
+"""
+
+import argparse
+import json
+import os
+from io import StringIO
+
+import pandas as pd
+
+from vote_schema import VOTE_COLUMNS, votes_to_df
+from vote_rounds import DEFAULT_ROUND_ID, votes_collection_path
+
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_FILE = "votes_snapshot.jsonl"
+
+
+def write_snapshot(df_votes, path=SNAPSHOT_FILE, snapshot_at=None, round_info=None):
+    """
+    Write a typed votes frame to a snapshot file; returns the number of votes.
+    round_info is the round the votes belong to (a vote_rounds round dict).
+    """
+    snapshot_at = pd.Timestamp.now(tz='UTC') if snapshot_at is None else snapshot_at
+    df = df_votes[VOTE_COLUMNS]
+    temp_path = path + ".tmp"
+
+    if path.endswith('.parquet'):
+        df = df.copy()
+        df.attrs['snapshot_at'] = snapshot_at.isoformat()
+        df.attrs['round'] = round_info
+        df.to_parquet(temp_path, index=False)
+    else:
+        with open(temp_path, 'w', encoding='utf-8', newline='\n') as f:
+            header = {'snapshot_at': snapshot_at.isoformat(), 'format': SNAPSHOT_FORMAT, 'votes': len(df), 'round': round_info}
+            f.write(json.dumps(header) + "\n")
+            if len(df):
+                f.write(df.to_json(orient='records', lines=True, date_format='iso', date_unit='us'))
+                f.write("\n")
+
+    # Publish atomically so the dashboard never loads a half-written file
+    os.replace(temp_path, path)
+    return len(df)
+
+
+def export_snapshot(db, round_info, path=SNAPSHOT_FILE):
+    """Stream one round's votes collection from Firestore into a snapshot file"""
+    collection = votes_collection_path(round_info['id'])
+    df_votes = votes_to_df(doc.to_dict() for doc in db.collection(collection).stream())
+    return write_snapshot(df_votes, path, round_info=round_info)
+
+
+def read_snapshot(path):
+    """
+    Return (typed votes frame, snapshot time as a UTC Timestamp, round dict).
+    The round is None for snapshots written before rounds were recorded.
+    """
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+        snapshot_at = df.attrs.get('snapshot_at')
+        round_info = df.attrs.get('round')
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            body = f.read()
+        snapshot_at = header['snapshot_at']
+        round_info = header.get('round')
+        if body.strip():
+            df = pd.read_json(StringIO(body), lines=True, dtype=False, convert_dates=False)
+            df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True, format='ISO8601')
+        else:
+            df = pd.DataFrame(columns=VOTE_COLUMNS)
+
+    if snapshot_at is None:
+        snapshot_at = pd.Timestamp(os.path.getmtime(path), unit='s', tz='UTC')
+    return votes_to_df(df), pd.Timestamp(snapshot_at).tz_convert('UTC'), round_info
+
+
+class VoteSnapshot:
+    """
+    Read-only stand-in for VoteWatcher: serves the snapshot's votes through
+    current_votes() with a revision that never changes. `round` is the round
+    the snapshot was taken from (None for older snapshots).
+    """
+
+    revision = 0
+
+    def __init__(self, path):
+        self.path = path
+        self.votes, self.snapshot_at, self.round = read_snapshot(path)
+
+    def current_votes(self, wait_for=None, timeout=None):
+        return self.votes
+
+
+if __name__ == "__main__":
+    import firebase_admin
+    from firebase_admin import credentials, firestore
+
+    from vote_rounds import load_rounds
+
+    parser = argparse.ArgumentParser(description="Export one round's votes from Firestore to a local snapshot file")
+    parser.add_argument("--credentials", required=True, help="Service account JSON file")
+    parser.add_argument("--database", default="dbsv", help="Firestore database ID")
+    parser.add_argument("--round", default=DEFAULT_ROUND_ID, help="Round ID (see the rounds collection)")
+    parser.add_argument("--applicants-file", default="fOutputAndaReport.xlsx", help="Applicant report of the default round")
+    parser.add_argument("--output", default=SNAPSHOT_FILE, help="Snapshot file (.jsonl or .parquet)")
+    args = parser.parse_args()
+
+    firebase_admin.initialize_app(credentials.Certificate(args.credentials))
+    db = firestore.client(database_id=args.database)
+    rounds_by_id = {r['id']: r for r in load_rounds(db, args.applicants_file)}
+    if args.round not in rounds_by_id:
+        parser.error(f"unknown round '{args.round}'; rounds: {', '.join(rounds_by_id)}")
+    count = export_snapshot(db, rounds_by_id[args.round], args.output)
+    print(f"✅ Wrote {count} votes of round '{rounds_by_id[args.round]['label']}' to {args.output}")
@@ -1,50 +1,26 @@
-import streamlit as st
-import pandas as pd
+import time
 import os
-from datetime import datetime
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill
 import json
-import base64
-import firebase_admin
-from firebase_admin import credentials, firestore
+import threading
+from contextlib import contextmanager
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 
 # Page config
 st.set_page_config(page_title="STING Applicant Voting", layout="wide")
 
-# ===== FIRESTORE INITIALIZATION =====
-@st.cache_resource
-def init_firestore():
-    """Initialize Firestore connection"""
-    try:
-        # Build credentials dict from Streamlit secrets
-        creds_dict = {
-            "type": "service_account",
-            "project_id": st.secrets["project_id"],
-            "private_key_id": st.secrets["private_key_id"],
-            "private_key": st.secrets["private_key"],
-            "client_email": st.secrets["client_email"],
-            "client_id": st.secrets["client_id"],
-            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-            "token_uri": "https://oauth2.googleapis.com/token",
-            "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-            "client_x509_cert_url": st.secrets["client_x509_cert_url"],
-            "universe_domain": "googleapis.com"
-        }
-        
-        # Initialize Firebase
-        cred = credentials.Certificate(creds_dict)
-        firebase_admin.initialize_app(cred)
-        db = firestore.client(database_id="dbsv")
-        return db
-    except KeyError as e:
-        st.error(f"❌ Missing secret: {str(e)}")
-        st.stop()
-    except Exception as e:
-        st.error(f"❌ Error initializing Firestore: {str(e)}")
-        st.stop()
+# ===== STARTUP TIMING =====
+@st.cache_resource(show_spinner=False)
+def startup_timings():
+    """Process-wide {step: seconds}; each step keeps its first (cold-start) cost"""
+    return {}
 
-db = init_firestore()
+@contextmanager
+def timed(step, timings=None):
+    timings = startup_timings() if timings is None else timings
+    start = time.perf_counter()
+    yield
+    timings.setdefault(step, time.perf_counter() - start)
 
 # ===== PASSWORD AUTHENTICATION =====
 def check_password():
@@ -93,81 +69,275 @@ def check_password():
 # Check password before showing app
 check_password()
 
+# ===== DEFERRED IMPORTS =====
+# Heavy modules load only once the password gate passes, so the login screen
+# doesn't pay for them. Later reruns hit sys.modules and cost nothing.
+with timed("Import pandas"):
+    import pandas as pd
+with timed("Import firebase_admin"):
+    import firebase_admin
+    from firebase_admin import credentials, firestore, firestore_async
+with timed("Import vote modules"):
+    from applicant_report import classify_expertise, analytics_artifact_path, EXPERIENCE_LEVELS_SHORT
+    from vote_fetch import VoteFetcher, VoteWatcher, votes_page
+    from vote_progress import ProgressIndex
+    from vote_rounds import (DEFAULT_ROUND_ID, SHORTLIST_APPROVE_SHARE, default_round, rounds_from_docs,
+                             create_round, default_shortlist, votes_collection_path)
+    from vote_schema import VOTE_STATUSES, DISPLAY_TIMEZONE, votes_to_df, latest_votes, localize_timestamps, vote_fingerprint
+    from vote_snapshot import VoteSnapshot, write_snapshot, SNAPSHOT_FILE
+
+# ===== FIRESTORE INITIALIZATION =====
+@st.cache_resource
+def init_firestore():
+    """Initialize Firestore connection"""
+    try:
+        start = time.perf_counter()
+        # Build credentials dict from Streamlit secrets
+        creds_dict = {
+            "type": "service_account",
+            "project_id": st.secrets["project_id"],
+            "private_key_id": st.secrets["private_key_id"],
+            "private_key": st.secrets["private_key"],
+            "client_email": st.secrets["client_email"],
+            "client_id": st.secrets["client_id"],
+            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+            "client_x509_cert_url": st.secrets["client_x509_cert_url"],
+            "universe_domain": "googleapis.com"
+        }
+        
+        # Initialize Firebase
+        cred = credentials.Certificate(creds_dict)
+        firebase_admin.initialize_app(cred)
+        db = firestore.client(database_id="dbsv")
+        startup_timings().setdefault("Firestore init", time.perf_counter() - start)
+        return db
+    except KeyError as e:
+        st.error(f"❌ Missing secret: {str(e)}")
+        st.stop()
+    except Exception as e:
+        st.error(f"❌ Error initializing Firestore: {str(e)}")
+        st.stop()
+
+@st.cache_resource
+def init_vote_fetcher():
+    """Async Firestore client (on its own event loop) for the reads that go to Firestore"""
+    with timed("Vote fetcher init"):
+        return VoteFetcher(firestore_async.client(database_id="dbsv"))
+
+@st.cache_resource
+def init_vote_watcher(collection):
+    """Snapshot listener that flags new votes in one round; None if listening isn't available"""
+    try:
+        return VoteWatcher(db, collection)
+    except Exception:
+        return None
+
+# Offline mode: serve votes from a local snapshot file (see vote_snapshot.py)
+# instead of Firestore. The dashboard is read-only and makes no network calls.
+VOTE_SNAPSHOT = os.environ.get("VOTE_SNAPSHOT") or st.secrets.get("vote_snapshot")
+READ_ONLY = bool(VOTE_SNAPSHOT)
+
+@st.cache_resource
+def load_vote_snapshot(path, mtime):
+    """Snapshot votes, loaded once per file version"""
+    with timed("Load vote snapshot"):
+        return VoteSnapshot(path)
+
+if READ_ONLY:
+    if not os.path.exists(VOTE_SNAPSHOT):
+        st.error(f"❌ Error: vote snapshot {VOTE_SNAPSHOT} not found!")
+        st.stop()
+    # The snapshot serves votes like VoteWatcher and never reports changes
+    db = fetcher = None
+    snapshot = vote_watcher = load_vote_snapshot(VOTE_SNAPSHOT, os.path.getmtime(VOTE_SNAPSHOT))
+else:
+    db = init_firestore()
+    fetcher = init_vote_fetcher()
+
+# Results/Export sections rerun on their own at this interval (seconds) to pick up new votes
+RESULTS_REFRESH_SECONDS = None if READ_ONLY else st.secrets.get("results_refresh_seconds", 15)
+
+# Applicant blocks shown per page of the Vote tab; every keyed widget on a page adds to each rerun
+APPLICANTS_PER_PAGE = st.secrets.get("applicants_per_page", 25)
+
+
+# ===== ROUNDS =====
+# Applicant report for the default round (and for the offline snapshot)
+DEFAULT_APPLICANTS_FILE = "fOutputAndaReport.xlsx"
+
+@st.cache_data(ttl=60, show_spinner=False)
+def list_rounds():
+    """Round registry (see vote_rounds.py), re-read at most once a minute"""
+    try:
+        return rounds_from_docs(fetcher.rounds(), DEFAULT_APPLICANTS_FILE)
+    except Exception:
+        return [default_round(DEFAULT_APPLICANTS_FILE)]
+
+# A snapshot runs the round it was taken from (older snapshots predate rounds: the default one)
+if READ_ONLY:
+    rounds = [snapshot.round or default_round(DEFAULT_APPLICANTS_FILE)]
+else:
+    rounds = list_rounds()
+rounds_by_id = {r['id']: r for r in rounds}
+
+# Switch to a round started in this session; otherwise default to the latest round
+if 'pending_round' in st.session_state:
+    st.session_state['round_id'] = st.session_state.pop('pending_round')
+if st.session_state.get('round_id') not in rounds_by_id:
+    st.session_state['round_id'] = rounds[-1]['id']
+
+ROUND_ID = st.sidebar.selectbox(
+    "🔁 Round",
+    list(rounds_by_id),
+    key="round_id",
+    format_func=lambda round_id: rounds_by_id[round_id]['label'],
+    disabled=READ_ONLY
+)
+ACTIVE_ROUND = rounds_by_id[ROUND_ID]
+
+# Every vote read and write below goes to the active round's collection
+VOTES_COLLECTION = votes_collection_path(ROUND_ID)
+if not READ_ONLY:
+    vote_watcher = init_vote_watcher(VOTES_COLLECTION)
+
+
 # ===== MAIN APP =====
 st.title("🗳️ STING Applicant Voting Dashboard")
 
-# File path for Excel
-excel_file = "fOutputAndaReport.xlsx"
+if READ_ONLY:
+    st.info(f"📸 Snapshot as of {snapshot.snapshot_at.tz_convert(DISPLAY_TIMEZONE):%Y-%m-%d %H:%M %Z} "
+            f"({len(snapshot.votes)} votes from `{VOTE_SNAPSHOT}`). Read-only: voting is disabled.")
+
+# File path for Excel (each cohort's round names its own report)
+excel_file = ACTIVE_ROUND['applicants_file']
 
 # Check if Excel file exists
 if not os.path.exists(excel_file):
     st.error(f"❌ Error: {excel_file} not found!")
-    st.info("📌 Please ensure 'fOutputAndaReport.xlsx' is uploaded to the GitHub repository.")
+    st.info(f"📌 Please ensure '{excel_file}' is uploaded to the GitHub repository.")
     st.stop()
 
-# Load applicants from Excel
+# Report loaders below are keyed on its mtime, so a report republished by parse_tsv.py (e.g. watch mode) is picked up
+excel_mtime = os.path.getmtime(excel_file)
+
+# Question IDs behind the Vote tab header fields
+PROFILE_QUESTIONS = {'unit': 'Q4', 'experience': 'Q24', 'background': 'Q22'}
+
+# Question-text matches for reports generated before question IDs were kept
+LEGACY_PROFILE_MATCHES = {'unit': 'unit', 'experience': 'experience level', 'background': 'background'}
+
+def build_profile(responses_by_id, responses_by_text):
+    """Resolve the header fields and derived tags for one applicant once"""
+    profile = {}
+    for field, qid in PROFILE_QUESTIONS.items():
+        value = responses_by_id.get(qid)
+        if value is None:
+            match = LEGACY_PROFILE_MATCHES[field]
+            value = next((r for q, r in responses_by_text.items() if match in q.lower()), None)
+        profile[field] = value
+
+    background = profile['background']
+    profile['background_short'] = background[:100] + "..." if background and len(str(background)) > 100 else background
+
+    # Tags: unit, short experience level ("Novice", ...) and expertise areas from the background
+    tags = []
+    if profile['unit'] and profile['unit'] != "[No response]":
+        tags.append(profile['unit'])
+    if profile['experience'] and profile['experience'] != "[No response]":
+        tags.append(profile['experience'].split(' (')[0])
+    tags.extend(classify_expertise(str(background)) if background else [])
+    profile['tags'] = tags
+    return profile
+
+# Load applicants from Excel (cached per report version, so each cohort is loaded once)
 @st.cache_data
-def load_applicants():
-    wb = openpyxl.load_workbook(excel_file)
+def load_applicants(path, mtime):
+    """Returns ({applicant: {question: response}}, {applicant: profile})"""
+    import openpyxl
+    wb = openpyxl.load_workbook(path)
     applicants = {}
+    profiles = {}
 
     # Get all applicant sheet names (skip Summary sheet)
     for sheet_name in wb.sheetnames:
         if sheet_name != 'Summary':
             ws = wb[sheet_name]
+
+            # Reports with a 'Question ID' column key fields by ID; older ones only have text
+            header = [cell.value for cell in ws[1]]
+            id_col = header.index('Question ID') if 'Question ID' in header else None
+            question_col = header.index('Question') if 'Question' in header else 0
+            response_col = header.index('Response') if 'Response' in header else 1
+
             applicant_data = {}
+            responses_by_id = {}
             for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
-                question = row[0].value
-                response = row[1].value
+                question = row[question_col].value
+                response = row[response_col].value
                 if question:
-                    applicant_data[question] = response if response else "[No response]"        
+                    response = response if response else "[No response]"
+                    applicant_data[question] = response
+                    if id_col is not None and row[id_col].value:
+                        responses_by_id[row[id_col].value] = response
             applicants[sheet_name] = applicant_data
+            profiles[sheet_name] = build_profile(responses_by_id, applicant_data)
 
-    return applicants
+    return applicants, profiles
+
+# Applicant-pool analytics precomputed by parse_tsv.py (keyed on file mtime so a new report is picked up)
+@st.cache_data
+def load_pool_analytics(path, mtime):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# Consensus leaderboard, recomputed only when the votes (fingerprint) or applicant list change
+@st.cache_data(max_entries=8)
+def compute_leaderboard(fingerprint, applicant_names, _df_latest):
+    from vote_ranking import rank_applicants
+    return rank_applicants(_df_latest, applicant_names)
+
+# Inter-rater agreement, cached the same way as the leaderboard
+@st.cache_data(max_entries=8)
+def compute_agreement(fingerprint, applicant_names, _df_latest):
+    from vote_agreement import agreement_report
+    return agreement_report(_df_latest, applicant_names)
+
+# Full-text index over all responses, built once per applicant file version
+@st.cache_resource(show_spinner=False)
+def load_search_index(path, mtime):
+    from applicant_search import ApplicantSearchIndex
+    applicants, profiles = load_applicants(path, mtime)
+    return ApplicantSearchIndex(applicants, profiles)
 
 # Load votes from Firestore
 def load_votes():
+    if READ_ONLY:
+        return snapshot.votes
     try:
-        votes_ref = db.collection('votes').stream()
-        votes_data = []
-        for doc in votes_ref:
-            vote = doc.to_dict()
-            votes_data.append(vote)
-        
-        if votes_data:
-            return pd.DataFrame(votes_data)
-        else:
-            return pd.DataFrame(columns=[
-                'timestamp', 'judge_name', 'applicant_name', 'status',
-                'rating', 'comment', 'original_status', 'original_rating', 'vote_version'
-            ])
+        return votes_to_df(fetcher.votes(VOTES_COLLECTION))
     except Exception as e:
         st.error(f"Error loading votes: {str(e)}")
-        return pd.DataFrame(columns=[
-            'timestamp', 'judge_name', 'applicant_name', 'status',
-            'rating', 'comment', 'original_status', 'original_rating', 'vote_version'
-        ])
+        return votes_to_df([])
 
-# Save vote to Firestore
+# Save vote to Firestore; returns the saved vote, or None if it failed
 def save_vote(judge_name, applicant_name, status, rating, comment, original_status, original_rating):
     try:
-        df_votes = load_votes()
-        
         # Check if this judge already voted for this applicant
-        existing = df_votes[(df_votes['judge_name'] == judge_name) & 
-                            (df_votes['applicant_name'] == applicant_name)]
+        existing = get_judge_vote(judge_name, applicant_name)
         
-        if not existing.empty:
+        if existing is not None:
             # This is a revision - mark original
-            original_status = existing.iloc[-1]['status']
-            original_rating = existing.iloc[-1]['rating']
-            vote_version = int(existing.iloc[-1]['vote_version']) + 1
+            original_status = existing['status']
+            original_rating = existing['rating']
+            vote_version = int(existing['vote_version']) + 1
         else:
             vote_version = 1
         
         # Create vote document
         vote_data = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': firestore.SERVER_TIMESTAMP,
             'judge_name': judge_name,
             'applicant_name': applicant_name,
             'status': status,
@@ -178,45 +348,214 @@ def save_vote(judge_name, applicant_name, status, rating, comment, original_stat
             'vote_version': vote_version
         }
         
-        # Generate document ID
+        # Generate document ID (unique within the round's collection)
         doc_id = f"{judge_name}_{applicant_name}_{vote_version}"
         
         # Save to Firestore
-        db.collection('votes').document(doc_id).set(vote_data)
+        db.collection(VOTES_COLLECTION).document(doc_id).set(vote_data)
+        st.session_state['pending_vote_id'] = doc_id
         
-        # Verify write by reloading
-        updated_votes = load_votes()
-        latest_vote = updated_votes[(updated_votes['judge_name'] == judge_name) & 
-                                   (updated_votes['applicant_name'] == applicant_name)]
+        # Verify write by reading back the latest version; a session without a
+        # listener refreshes its own copy of the round's votes in the same round trip
+        reads = fetcher.after_vote(VOTES_COLLECTION, judge_name, applicant_name, include_votes=vote_watcher is None)
+        if reads['votes'] is not None:
+            set_session_votes(votes_to_df(reads['votes']))
+        else:
+            st.session_state['votes_stale'] = True
+        latest_vote = typed_vote(reads['judge_vote'])
         
-        if not latest_vote.empty:
+        if latest_vote is not None and int(latest_vote['vote_version']) == vote_version:
             st.success(f"✅ Vote saved for {applicant_name}")
+            return latest_vote
         else:
             st.error(f"❌ Error: Vote not found after saving")
     except Exception as e:
         st.error(f"❌ Error saving vote: {str(e)}")
+    return None
+
+# All votes of the round, shared by the Vote, Results and Export sections.
+# Served from the snapshot listener's copy, which every session shares; after
+# this session votes, it waits (briefly) for the listener to deliver that vote.
+# Without a listener the session keeps its own copy, reloaded after this
+# session votes or once it's older than the refresh interval.
+def set_session_votes(df_votes):
+    st.session_state['df_votes'] = df_votes
+    st.session_state['votes_collection'] = VOTES_COLLECTION
+    st.session_state['votes_loaded_at'] = time.monotonic()
+    st.session_state['votes_stale'] = False
+
+def session_votes():
+    if vote_watcher is not None:
+        df_votes = vote_watcher.current_votes(wait_for=st.session_state.pop('pending_vote_id', None))
+        if df_votes is not None:
+            return df_votes
+
+    stale = (st.session_state.get('votes_stale', True)
+             or st.session_state['votes_collection'] != VOTES_COLLECTION
+             or time.monotonic() - st.session_state['votes_loaded_at'] >= RESULTS_REFRESH_SECONDS)
+    if stale:
+        set_session_votes(load_votes())
+    return st.session_state['df_votes']
+
+# Lookups below are filtered server-side and rely on the composite indexes in
+# firestore.indexes.json (deploy with `firebase deploy --only firestore:indexes`)
+
+# One vote document as a typed row (None stays None)
+def typed_vote(vote):
+    if vote is None:
+        return None
+    return votes_to_df([vote]).iloc[0]
 
 # Get latest vote for applicant from a judge
 def get_judge_vote(judge_name, applicant_name):
-    df_votes = load_votes()
-    judge_votes = df_votes[(df_votes['judge_name'] == judge_name) &
-                           (df_votes['applicant_name'] == applicant_name)]
-
-    if judge_votes.empty:
-        return None
-    return judge_votes.iloc[-1]
-
-# Get all votes for an applicant
-def get_applicant_votes(applicant_name):
-    df_votes = load_votes()
-    return df_votes[df_votes['applicant_name'] == applicant_name]
+    return typed_vote(fetcher.judge_vote(VOTES_COLLECTION, judge_name, applicant_name))
 
 # Create tabs
-tab1, tab2, tab3 = st.tabs(["🗳️ Vote", "📊 Results Dashboard", "📥 Export Results"])    
+tab1, tab2, tab3, tab4 = st.tabs(["🗳️ Vote", "📊 Results Dashboard", "📥 Export Results", "📈 Applicant Pool"])    
 
-applicants = load_applicants()
+with timed("Load applicants (openpyxl)"):
+    applicants, profiles = load_applicants(excel_file, excel_mtime)
 applicant_names = sorted(list(applicants.keys()))
 
+# A carried-over round only votes on the shortlist from its parent round
+if ACTIVE_ROUND['applicants'] is not None:
+    shortlisted = set(ACTIVE_ROUND['applicants'])
+    applicant_names = [name for name in applicant_names if name in shortlisted]
+    parent = rounds_by_id.get(ACTIVE_ROUND['parent'])
+    st.caption(f"🔁 {ACTIVE_ROUND['label']}: {len(applicant_names)} applicants carried over"
+               + (f" from {parent['label']}" if parent else ""))
+
+# ===== BACKGROUND PREWARM =====
+@st.cache_resource(show_spinner=False)
+def start_prewarm():
+    """
+    Once per process, warm what the first vote page needs (search index,
+    ranking modules) while the judge is still typing their name. The async
+    Firestore channel is already open: the round list is read through it.
+    Best effort: anything that fails here just runs on first use instead.
+    """
+    timings = startup_timings()
+
+    def import_ranking_modules():
+        import vote_ranking, vote_agreement
+
+    def prewarm():
+        steps = [
+            ("Prewarm: search index", lambda: load_search_index(excel_file, excel_mtime)),
+            ("Prewarm: ranking modules", import_ranking_modules),
+        ]
+        for step, warm in steps:
+            try:
+                with timed(step, timings):
+                    warm()
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=prewarm, name="prewarm", daemon=True)
+    add_script_run_ctx(thread)
+    thread.start()
+    return thread
+
+start_prewarm()
+
+with st.sidebar.expander("⏱️ Startup timing"):
+    timings = startup_timings()
+    st.dataframe(
+        pd.DataFrame({'Step': list(timings), 'Seconds': list(timings.values())}),
+        hide_index=True,
+        column_config={'Seconds': st.column_config.NumberColumn(format="%.3f")}
+    )
+    st.caption(f"Cold-start cost of each step, total {sum(timings.values()):.2f}s. Prewarm steps run in the background.")
+
+# Each applicant block is a fragment: widget changes and submits rerun only that block
+@st.fragment
+def render_applicant_block(judge_name, applicant_name, expanded=False):
+    page = st.session_state['vote_page']
+    with st.expander(f"📋 {applicant_name}", expanded=expanded):
+        # Get applicant profile (header fields resolved once in load_applicants)
+        profile = profiles[applicant_name]
+
+        # Display applicant info
+        info_cols = st.columns(3)
+        with info_cols[0]:
+            st.write("**Unit/Lab:**")
+            if profile['unit'] is not None:
+                st.write(profile['unit'])
+
+        with info_cols[1]:
+            st.write("**Experience:**")
+            if profile['experience'] is not None:
+                st.write(profile['experience'])
+
+        with info_cols[2]:
+            st.write("**Background:**")
+            if profile['background_short'] is not None:
+                st.write(profile['background_short'])
+
+        if profile['tags']:
+            st.caption(" · ".join(profile['tags']))
+
+        st.markdown("---")
+
+        # Show other judges' votes for this applicant
+        applicant_votes = votes_to_df(page['applicant_votes'][applicant_name])
+        if not applicant_votes.empty:
+            st.subheader("👀 Other Judges' Votes & Comments:")
+            for idx, vote in applicant_votes.iterrows():
+                if vote['judge_name'] != judge_name:
+                    status_emoji = {"Approve": "✅", "Reject": "❌", "Maybe": "❓"}        
+                    emoji = status_emoji.get(vote['status'], "")
+                    st.write(f"**{vote['judge_name']}** {emoji} {vote['status']} | ⭐ {int(vote['rating'])}/5")
+                    if pd.notna(vote['comment']) and vote['comment']:
+                        st.write(f"_Comment: {vote['comment']}_")
+                    if pd.notna(vote['original_status']) and vote['original_status']:       
+                        st.caption(f"Original vote: {vote['original_status']} | ⭐ {int(vote['original_rating'])}/5")
+            st.divider()
+
+        # Get current judge's vote if exists
+        judge_vote = page['judge_votes'][applicant_name]
+        current_vote = pd.Series(judge_vote) if judge_vote is not None else None
+
+        st.subheader("🗳️ Your Vote:")
+
+        # Voting columns
+        vote_col1, vote_col2 = st.columns(2)
+
+        with vote_col1:
+            status = st.radio(
+                "Status:",
+                options=VOTE_STATUSES,
+                key=f"status_{ROUND_ID}_{applicant_name}",
+                disabled=READ_ONLY,
+                index=VOTE_STATUSES.index(current_vote['status']) if current_vote is not None else 0
+            )
+
+        with vote_col2:
+            rating = st.slider(
+                "Rating (1-5):",
+                min_value=1,
+                max_value=5,
+                value=int(current_vote['rating']) if current_vote is not None else 3,       
+                key=f"rating_{ROUND_ID}_{applicant_name}",
+                disabled=READ_ONLY
+            )
+
+        comment = st.text_area(
+            "Optional Comment:",
+            value=current_vote['comment'] if (current_vote is not None and pd.notna(current_vote['comment'])) else "",
+            key=f"comment_{ROUND_ID}_{applicant_name}",
+            disabled=READ_ONLY,
+            placeholder="Explain your vote..."
+        )
+
+        if st.button(f"💾 Submit Vote for {applicant_name}", key=f"submit_{ROUND_ID}_{applicant_name}", disabled=READ_ONLY):
+            original_status = current_vote['status'] if current_vote is not None else None  
+            original_rating = current_vote['rating'] if current_vote is not None else None  
+            saved_vote = save_vote(judge_name, applicant_name, status, rating, comment, original_status, original_rating)
+            if saved_vote is not None:
+                # Keep this block's data current (save_vote already refreshed the round's votes)
+                page['judge_votes'][applicant_name] = saved_vote.to_dict()
+
 # ===== TAB 1: VOTING INTERFACE =====
 with tab1:
     st.header("Submit Your Votes")
@@ -225,107 +564,86 @@ with tab1:
     col1, col2 = st.columns([2, 3])
     with col1:
         judge_name = st.text_input("👤 Enter your name:", key="judge_name_input", placeholder="e.g., John Smith")
+    with col2:
+        search_query = st.text_input(
+            "🔎 Search responses:",
+            key="search_query",
+            placeholder='e.g., "machine learning" AND ACL OR llm'
+        )
 
     if not judge_name:
         st.warning("⚠️ Please enter your name to continue voting")
         st.stop()
 
+    # Restrict the Vote tab to search matches, best first
+    vote_applicants = applicant_names
+    if search_query.strip():
+        round_applicants = set(applicant_names)
+        search_results = [result for result in load_search_index(excel_file, excel_mtime).search(search_query)
+                          if result[0] in round_applicants]
+        vote_applicants = [name for name, _, _ in search_results]
+        st.caption(f"{len(search_results)} of {len(applicant_names)} applicants match")
+        if search_results:
+            with st.expander("🔎 Search matches", expanded=True):
+                for name, score, snippet in search_results:
+                    st.markdown(f"**{name}** ({score:.1f}) — {snippet}")
+
+    # Progress and every vote shown below come from the round's votes already in memory
+    df_votes = session_votes()
+    progress = ProgressIndex(df_votes, applicant_names)
+    voted, total, completion = progress.completion(judge_name)
+    st.progress(completion, text=f"📈 {voted}/{total} applicants voted ({completion:.0%})")
+
+    remaining = progress.remaining(judge_name, vote_applicants)
+    with st.expander(f"📝 Remaining ({len(remaining)})"):
+        st.write(", ".join(remaining) if remaining else "🎉 You've voted on every applicant")
+
+    # One at a time: render only the next unvoted applicant instead of the whole list
+    focus = st.toggle("🎯 Show only the next unvoted applicant", key="focus_next_unvoted")
+    if focus:
+        skipped = st.session_state.setdefault('skipped_applicants', set())
+        next_applicant = progress.next_unvoted(judge_name, vote_applicants, skip=skipped)
+        if next_applicant is None and skipped:
+            # Everything left was skipped: go round again
+            skipped.clear()
+            next_applicant = progress.next_unvoted(judge_name, vote_applicants)
+        vote_applicants = [next_applicant] if next_applicant else []
+
+        nav_col1, nav_col2 = st.columns(2)
+        nav_col1.button("⏭️ Next unvoted", help="Submit your vote, then move on", disabled=next_applicant is None)
+        if nav_col2.button("↪️ Skip for now", disabled=next_applicant is None):
+            skipped.add(next_applicant)
+            st.rerun()
+
+    # Long lists are paged so a rerun renders a bounded number of blocks
+    page_count = max(1, -(-len(vote_applicants) // APPLICANTS_PER_PAGE))
+    if page_count > 1:
+        page_number = st.number_input(f"📄 Page (of {page_count})", min_value=1, max_value=page_count, value=1, key="vote_page_number")
+        start = (page_number - 1) * APPLICANTS_PER_PAGE
+        vote_applicants = vote_applicants[start:start + APPLICANTS_PER_PAGE]
+
+    # Vote histories and this judge's votes for the listed applicants (no per-applicant reads)
+    st.session_state['vote_page'] = votes_page(df_votes, judge_name, vote_applicants)
+
     st.divider()
 
     # Display all applicants for voting
-    for applicant_name in applicant_names:
-        with st.expander(f"📋 {applicant_name}", expanded=False):
-            # Get applicant details
-            details = applicants[applicant_name]
-
-            # Display applicant info
-            info_cols = st.columns(3)
-            with info_cols[0]:
-                st.write("**Unit/Lab:**")
-                for q, r in details.items():
-                    if "unit" in q.lower():
-                        st.write(r)
-                        break
-
-            with info_cols[1]:
-                st.write("**Experience:**")
-                for q, r in details.items():
-                    if "experience level" in q.lower():
-                        st.write(r)
-                        break
-
-            with info_cols[2]:
-                st.write("**Background:**")
-                for q, r in details.items():
-                    if "background" in q.lower():
-                        st.write(r[:100] + "..." if len(str(r)) > 100 else r)
-                        break
-
-            st.markdown("---")
-
-            # Show other judges' votes for this applicant
-            applicant_votes = get_applicant_votes(applicant_name)
-            if not applicant_votes.empty:
-                st.subheader("👀 Other Judges' Votes & Comments:")
-                for idx, vote in applicant_votes.iterrows():
-                    if vote['judge_name'] != judge_name:
-                        status_emoji = {"Approve": "✅", "Reject": "❌", "Maybe": "❓"}        
-                        emoji = status_emoji.get(vote['status'], "")
-                        st.write(f"**{vote['judge_name']}** {emoji} {vote['status']} | ⭐ {int(vote['rating'])}/5")
-                        if pd.notna(vote['comment']) and vote['comment']:
-                            st.write(f"_Comment: {vote['comment']}_")
-                        if pd.notna(vote['original_status']) and vote['original_status']:       
-                            st.caption(f"Original vote: {vote['original_status']} | ⭐ {int(vote['original_rating'])}/5")
-                st.divider()
-
-            # Get current judge's vote if exists
-            current_vote = get_judge_vote(judge_name, applicant_name)
-
-            st.subheader("🗳️ Your Vote:")
-
-            # Voting columns
-            vote_col1, vote_col2 = st.columns(2)
-
-            with vote_col1:
-                status = st.radio(
-                    "Status:",
-                    options=["Approve", "Reject", "Maybe"],
-                    key=f"status_{applicant_name}",
-                    index=["Approve", "Reject", "Maybe"].index(current_vote['status']) if current_vote is not None else 0
-                )
-
-            with vote_col2:
-                rating = st.slider(
-                    "Rating (1-5):",
-                    min_value=1,
-                    max_value=5,
-                    value=int(current_vote['rating']) if current_vote is not None else 3,       
-                    key=f"rating_{applicant_name}"
-                )
-
-            comment = st.text_area(
-                "Optional Comment:",
-                value=current_vote['comment'] if (current_vote is not None and pd.notna(current_vote['comment'])) else "",
-                key=f"comment_{applicant_name}",
-                placeholder="Explain your vote..."
-            )
-
-            if st.button(f"💾 Submit Vote for {applicant_name}", key=f"submit_{applicant_name}"):
-                original_status = current_vote['status'] if current_vote is not None else None  
-                original_rating = current_vote['rating'] if current_vote is not None else None  
-                save_vote(judge_name, applicant_name, status, rating, comment, original_status, original_rating)
+    for applicant_name in vote_applicants:
+        render_applicant_block(judge_name, applicant_name, expanded=focus)
 
 # ===== TAB 2: RESULTS DASHBOARD =====
-with tab2:
-    st.header("📊 Voting Results")
-
-    df_votes = load_votes()
+@st.fragment(run_every=RESULTS_REFRESH_SECONDS)
+def render_results():
+    """Results section; reruns on its own so new votes show up without a page refresh"""
+    df_votes = session_votes()
+    if not READ_ONLY:
+        st.caption(f"🔄 Updated {pd.Timestamp.now(tz=DISPLAY_TIMEZONE):%H:%M:%S} · refreshes every {RESULTS_REFRESH_SECONDS}s")
 
     if df_votes.empty:
         st.info("No votes yet")
     else:
         # Get latest votes only (most recent from each judge)
-        df_latest = df_votes.sort_values('timestamp').groupby(['judge_name', 'applicant_name']).tail(1)
+        df_latest = latest_votes(df_votes)
 
         # Summary by applicant
         st.subheader("Vote Summary by Applicant")
@@ -354,18 +672,72 @@ with tab2:
 
         st.divider()
 
+        # Consensus ranking across judges
+        st.subheader("🏆 Consensus Leaderboard")
+        st.caption("Ratings are standardized per judge before averaging, so harsh and lenient judges count equally. "
+                   "CI is a 95% bootstrap interval over judges; Borda is the share of each judge's other applicants ranked below.")
+        leaderboard = compute_leaderboard(vote_fingerprint(df_latest), tuple(applicant_names), df_latest)
+        st.dataframe(
+            leaderboard,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                col: st.column_config.NumberColumn(format="%.2f")
+                for col in ['Consensus (z)', 'CI Low', 'CI High', 'Borda', 'Status Score', 'Mean Rating']
+            }
+        )
+
+        st.divider()
+
+        # Inter-rater agreement
+        st.subheader("🤝 Judge Agreement")
+        agreement = compute_agreement(vote_fingerprint(df_latest), tuple(applicant_names), df_latest)
+
+        col1, col2 = st.columns(2)
+        col1.metric("Fleiss' κ (status)", "N/A" if pd.isna(agreement['fleiss_kappa']) else f"{agreement['fleiss_kappa']:.2f}")
+        col2.metric("Krippendorff's α (rating)", "N/A" if pd.isna(agreement['krippendorff_alpha']) else f"{agreement['krippendorff_alpha']:.2f}")
+        st.caption("1 = perfect agreement, 0 = no better than chance. Δ Rating compares each judge to the mean of the other judges "
+                   "on the same applicants; negative means harsher. Outliers deviate well beyond the rest of the panel.")
+
+        # Shares are shown as percentages (printf formats can't scale a 0-1 fraction)
+        st.dataframe(
+            agreement['judges'].assign(**{'Status Disagreement': agreement['judges']['Status Disagreement'] * 100}),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'Mean Δ Rating': st.column_config.NumberColumn(format="%+.2f"),
+                'Mean |Δ Rating|': st.column_config.NumberColumn(format="%.2f"),
+                'Status Disagreement': st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100),
+            }
+        )
+
+        if agreement['contested'].empty:
+            st.info("No contested applicants")
+        else:
+            st.write(f"**⚠️ Contested applicants ({len(agreement['contested'])})**")
+            st.dataframe(
+                agreement['contested'],
+                use_container_width=True,
+                hide_index=True,
+                column_config={'Rating SD': st.column_config.NumberColumn(format="%.2f")}
+            )
+
+        st.divider()
+
         # Detailed votes by applicant
         st.subheader("Detailed Votes & Comments")
 
-        selected_applicant = st.selectbox("Select Applicant:", applicant_names)
-        applicant_votes = df_latest[df_latest['applicant_name'] == selected_applicant].sort_values('judge_name')
+        selected_applicant = st.selectbox("Select Applicant:", applicant_names, key="results_applicant")
+        applicant_votes = df_votes[df_votes['applicant_name'] == selected_applicant]
+        if not applicant_votes.empty:
+            applicant_votes = latest_votes(applicant_votes).sort_values('judge_name')
 
         if not applicant_votes.empty:
             for idx, vote in applicant_votes.iterrows():
                 status_emoji = {"Approve": "✅", "Reject": "❌", "Maybe": "❓"}
                 emoji = status_emoji.get(vote['status'], "")
 
-                st.write(f"**{vote['judge_name']}** {emoji} {vote['status']} | ⭐ {int(vote['rating'])}/5 | _{vote['timestamp']}_")
+                st.write(f"**{vote['judge_name']}** {emoji} {vote['status']} | ⭐ {int(vote['rating'])}/5 | _{vote['timestamp'].tz_convert(DISPLAY_TIMEZONE):%Y-%m-%d %H:%M:%S}_")
 
                 if pd.notna(vote['comment']) and vote['comment']:
                     st.write(f"> {vote['comment']}")
@@ -377,6 +749,18 @@ with tab2:
         else:
             st.info(f"No votes for {selected_applicant} yet")
 
+        # Judging progress for everyone, from the same pair index as the Vote tab (Completion shown in %)
+        st.subheader("🧭 Judging Progress")
+        progress_summary = ProgressIndex(df_votes, applicant_names).summary()
+        st.dataframe(
+            progress_summary.assign(Completion=progress_summary['Completion'] * 100),
+            use_container_width=True,
+            hide_index=True,
+            column_config={'Completion': st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100)}
+        )
+
+        st.divider()
+
         # Judge summary
         st.subheader("📋 Votes by Judge")
 
@@ -394,20 +778,25 @@ with tab2:
         df_judge_summary = pd.DataFrame(judge_summary)
         st.dataframe(df_judge_summary, use_container_width=True, hide_index=True)
 
-# ===== TAB 3: EXPORT RESULTS =====
-with tab3:
-    st.header("📥 Export Voting Results")
+with tab2:
+    st.header("📊 Voting Results")
+    render_results()
 
-    df_votes = load_votes()
+
+# ===== TAB 3: EXPORT RESULTS =====
+@st.fragment
+def render_export():
+    """Export section; generating a report reruns only this fragment"""
+    df_votes = session_votes()
 
     if df_votes.empty:
         st.warning("No votes to export yet")
     else:
         # Get latest votes only
-        df_latest = df_votes.sort_values('timestamp').groupby(['judge_name', 'applicant_name']).tail(1)
+        df_latest = latest_votes(df_votes)
 
         if st.button("📊 Generate Excel Summary Report"):
-            export_file = "Voting_Results_Summary.xlsx"
+            export_file = "Voting_Results_Summary.xlsx" if ROUND_ID == DEFAULT_ROUND_ID else f"Voting_Results_Summary_{ROUND_ID}.xlsx"
             
             # Create Excel workbook
             with pd.ExcelWriter(export_file, engine='openpyxl') as writer:
@@ -435,7 +824,7 @@ with tab3:
                 df_summary.to_excel(writer, sheet_name='Summary', index=False)
 
                 # Sheet 2: All Votes
-                df_votes_export = df_latest[['timestamp', 'judge_name', 'applicant_name', 'status', 'rating', 'comment']].copy()
+                df_votes_export = localize_timestamps(df_latest[['timestamp', 'judge_name', 'applicant_name', 'status', 'rating', 'comment']])
                 df_votes_export.to_excel(writer, sheet_name='All Votes', index=False)
 
                 # Sheet 3: Judge Summary
@@ -453,12 +842,137 @@ with tab3:
                 df_judge_summary = pd.DataFrame(judge_summary)
                 df_judge_summary.to_excel(writer, sheet_name='Judge Summary', index=False)      
 
+                # Sheet 4: Judge Agreement
+                agreement = compute_agreement(vote_fingerprint(df_latest), tuple(applicant_names), df_latest)
+                pd.DataFrame([
+                    {'Metric': "Fleiss' kappa (status)", 'Value': agreement['fleiss_kappa']},
+                    {'Metric': "Krippendorff's alpha (rating)", 'Value': agreement['krippendorff_alpha']},
+                ]).to_excel(writer, sheet_name='Judge Agreement', index=False)
+                agreement['judges'].to_excel(writer, sheet_name='Judge Agreement', index=False, startrow=4)
+
+                # Sheet 5: Contested Applicants
+                agreement['contested'].to_excel(writer, sheet_name='Contested Applicants', index=False)
+
             st.success(f"✅ Export complete! File saved as:\n`{export_file}`")
             st.balloons()
 
+        # Freeze the current votes for offline/read-only use once voting has closed
+        if not READ_ONLY and st.button("📸 Save Vote Snapshot"):
+            snapshot_file = SNAPSHOT_FILE if ROUND_ID == DEFAULT_ROUND_ID else f"votes_snapshot_{ROUND_ID}.jsonl"
+            count = write_snapshot(session_votes(), snapshot_file, round_info=ACTIVE_ROUND)
+            st.success(f"✅ Saved {count} votes to `{snapshot_file}`. "
+                       f"Set `vote_snapshot = \"{snapshot_file}\"` in secrets to run the dashboard from it.")
+
+        # Carry this round's shortlist into a new round (its votes start empty in their own collection)
+        if not READ_ONLY:
+            with st.expander("➡️ Start Next Round"):
+                next_label = st.text_input("Round name:", value=f"Round {len(rounds) + 1}", key=f"next_round_label_{ROUND_ID}")
+                shortlist = st.multiselect(
+                    "Applicants to carry over:",
+                    applicant_names,
+                    default=default_shortlist(df_latest, applicant_names),
+                    key=f"shortlist_{ROUND_ID}",
+                    help=f"Defaults to applicants with more than {SHORTLIST_APPROVE_SHARE:.0%} Approve among their judges' latest votes"
+                )
+                if st.button("➡️ Create Round", disabled=not (shortlist and next_label.strip())):
+                    # IDs taken since the round list was cached are skipped, not overwritten
+                    round_id = create_round(db, next_label.strip(), excel_file, shortlist, parent=ROUND_ID,
+                                            existing_ids=set(rounds_by_id))
+                    list_rounds.clear()
+                    st.session_state['pending_round'] = round_id
+                    st.rerun()
+
         st.divider()
         st.subheader("📋 Current Votes Preview:")
         st.dataframe(df_latest[['judge_name', 'applicant_name', 'status', 'rating', 'comment']].sort_values(['applicant_name', 'judge_name']), use_container_width=True, hide_index=True)       
 
+with tab3:
+    st.header("📥 Export Voting Results")
+    render_export()
+
+
+# ===== TAB 4: APPLICANT POOL ANALYTICS =====
+with tab4:
+    st.header("📈 Applicant Pool")
+
+    analytics_file = analytics_artifact_path(excel_file)
+    if not os.path.exists(analytics_file):
+        st.info(f"📌 No pool analytics found. Re-run parse_tsv.py to generate `{analytics_file}` next to the report.")
+    else:
+        analytics = load_pool_analytics(analytics_file, os.path.getmtime(analytics_file))
+
+        metric_cols = st.columns(3)
+        metric_cols[0].metric("Applicants", analytics['total_applicants'])
+        metric_cols[1].metric("Questions", analytics['total_questions'])
+        metric_cols[2].metric("Report Generated", analytics['generated'])
+
+        pool_col1, pool_col2 = st.columns(2)
+        with pool_col1:
+            st.subheader("Unit/Lab Participation")
+            df_labs = pd.DataFrame(analytics['labs'], columns=['lab', 'count', 'applicants'])
+            st.bar_chart(df_labs.set_index('lab')['count'])
+
+        with pool_col2:
+            st.subheader("Experience Distribution")
+            if analytics['experience'] is not None:
+                df_exp = pd.DataFrame(analytics['experience'])
+                df_exp['level'] = pd.Categorical(df_exp['level'], categories=df_exp['level'], ordered=True)
+                st.bar_chart(df_exp.set_index('level')['count'])
+            else:
+                st.caption("No experience question in this export")
+
+        if analytics['familiarity']:
+            st.subheader("Familiarity Ratings")
+            fam_cols = st.columns(len(analytics['familiarity']))
+            for col, fam in zip(fam_cols, analytics['familiarity']):
+                col.metric(fam['question'][:60], f"{fam['average']:.2f}/5", help=fam['question'])
+
+        if analytics['experience_by_lab'] is not None:
+            st.subheader("Experience by Lab")
+            df_cross = pd.DataFrame(
+                [row['counts'] for row in analytics['experience_by_lab']],
+                index=[row['lab'] for row in analytics['experience_by_lab']],
+                columns=EXPERIENCE_LEVELS_SHORT
+            )
+            st.dataframe(df_cross, use_container_width=True)
+
+        if analytics['workshop'] is not None:
+            st.subheader("Workshop Attendance")
+            st.bar_chart(pd.Series(analytics['workshop'], name='count'))
+
+        st.subheader("Themes & Patterns")
+        theme_cols = st.columns(3)
+        theme_sections = [
+            ('challenges', 'Common Challenges (Q33)'),
+            ('motivations', 'Top Motivations/Goals (Q21)'),
+            ('strengths', 'Key Strengths Cited (Q18)'),
+        ]
+        for col, (key, heading) in zip(theme_cols, theme_sections):
+            with col:
+                st.write(f"**{heading}**")
+                themes = analytics['themes'][key]
+                if themes:
+                    st.dataframe(pd.DataFrame(themes, columns=['Theme', 'Mentions']), use_container_width=True, hide_index=True)
+                else:
+                    st.caption("No themes extracted")
+
+        st.subheader("Capability Inventory")
+        cap_col1, cap_col2 = st.columns(2)
+        with cap_col1:
+            st.write("**Expertise Areas (Q22)**")
+            if analytics['expertise']:
+                st.bar_chart(pd.DataFrame(analytics['expertise'], columns=['category', 'count']).set_index('category')['count'])
+            else:
+                st.caption("No expertise areas identified")
+        with cap_col2:
+            st.write("**Research Focus Areas**")
+            if analytics['research_focus']:
+                st.bar_chart(pd.DataFrame(analytics['research_focus'], columns=['category', 'count']).set_index('category')['count'])
+            else:
+                st.caption("No research focus identified")
+
+        st.write("**Military/Leadership Experience**")
+        st.write(", ".join(analytics['military_leadership']) if analytics['military_leadership'] else "None identified")
+
 st.divider()
 st.caption("✅ Voting data is securely stored in Google Firestore")